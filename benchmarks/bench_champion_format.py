@@ -0,0 +1,72 @@
+# Micro-benchmark of the champion formatting done for one match embed: the player's
+# champion name, both team lists and the ban row. "before" reproduces the old
+# build-an-f-string-then-split path, "after" is the current Champion record path.
+#
+# Run from the repository root: python -m benchmarks.bench_champion_format
+import timeit
+
+import static_data
+from commands import format_team
+from match_view import MatchView, ParticipantView
+from static_data import get_champion
+
+ITERATIONS = 20000
+
+# The old lookup tables and lookup, rebuilt from the current static data
+legacy_names = {champion.id: champion.name for champion in static_data.current.champions.values()}
+legacy_emojis = {champion.id: champion.emoji for champion in static_data.current.champions.values()}
+
+
+def legacy_get_champion_name(champion_id):
+    champion_name = legacy_names.get(champion_id, "Unknown Champion")
+    emoji_name = legacy_emojis.get(champion_id, "<:blank:1283824838787596298>")
+    return f"{emoji_name} {champion_name}"
+
+
+def legacy_format_team(team, player=None):
+    champions = []
+    for participant in team:
+        champ_name_with_emoji = legacy_get_champion_name(participant.champion_id)
+        if participant is player:
+            emoji, champ_name = champ_name_with_emoji.split(' ', 1)
+            champions.append(f"{emoji} __**{champ_name}**__")
+        else:
+            champions.append(champ_name_with_emoji)
+    return ', '.join(champions)
+
+
+def render_before(match, player):
+    allies, enemies = match.allies_and_enemies(player)
+    champion_name = legacy_get_champion_name(player.champion_id).split(' ', 1)[-1]
+    bans = ' | '.join(legacy_get_champion_name(champion_id).split(' ')[0] for champion_id in match.banned_champion_ids)
+    return champion_name, legacy_format_team(allies, player), legacy_format_team(enemies), bans
+
+
+def render_after(match, player):
+    allies, enemies = match.allies_and_enemies(player)
+    champion_name = get_champion(player.champion_id).name
+    bans = ' | '.join(get_champion(champion_id).emoji for champion_id in match.banned_champion_ids)
+    return champion_name, format_team(allies, player), format_team(enemies), bans
+
+
+def sample_match():
+    champion_ids = sorted(legacy_names)[:20]
+    participants = [
+        ParticipantView(puuid=f'player-{i}', champion_id=champion_ids[i], team_id=100 if i < 5 else 200)
+        for i in range(10)
+    ]
+    return MatchView('NA1_0', 420, 0, 1800, participants, banned_champion_ids=champion_ids[10:20])
+
+
+def main():
+    match = sample_match()
+    player = match.participants[0]
+    assert render_before(match, player) == render_after(match, player)
+
+    for label, render in (('before', render_before), ('after', render_after)):
+        seconds = min(timeit.repeat(lambda: render(match, player), number=ITERATIONS, repeat=5))
+        print(f"{label:>6}: {seconds / ITERATIONS * 1e6:.2f} us per embed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+# End-to-end benchmark of /stalkmatches, /livegame and the spectator poll against the
+# local mock Riot server, with fake Discord interactions and channels. Reports latency
+# percentiles, time to first message, Riot calls per command and throughput.
+#
+# Run from the repository root:
+#   python -m benchmarks.bench_commands --iterations 200 --concurrency 10 --latency 0.05
+# Pass --max-p95 to exit non-zero when any scenario's p95 regresses past a budget (for CI).
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+from benchmarks.mock_riot import APP_RATE_LIMIT, MockRiotServer
+from rate_limiter import RateLimiter
+from riot_client import riot
+from match_cache import match_cache, MAX_CACHE_BYTES
+from identity_cache import identity_cache
+from warehouse import warehouse
+from tracking import TrackedPlayer, PlayerState, registry
+import commands
+from commands import stalkmatches_command, livegame_command
+from check_spectator import poll_player
+from events import bus
+from notifier import Notifier
+from outbox import Outbox
+
+RIOT_ID = 'Sourcewalker#Faust'
+
+
+# Stand-ins for the parts of discord.py the commands touch
+class FakeMessage:
+    def __init__(self, interaction):
+        self.interaction = interaction
+
+    async def edit(self, **kwargs):
+        self.interaction.record()
+
+
+class FakeResponse:
+    def __init__(self, interaction):
+        self.interaction = interaction
+        self.done = False
+
+    def is_done(self):
+        return self.done
+
+    async def defer(self, **kwargs):
+        self.done = True
+
+    async def send_message(self, content=None, **kwargs):
+        self.done = True
+        self.interaction.record(content)
+
+
+class FakeFollowup:
+    def __init__(self, interaction):
+        self.interaction = interaction
+
+    async def send(self, content=None, wait=False, **kwargs):
+        self.interaction.record(content)
+        return FakeMessage(self.interaction)
+
+
+class FakeInteraction:
+    def __init__(self):
+        self.user = SimpleNamespace(name='benchmark', avatar=SimpleNamespace(url='https://example.invalid/avatar.png'))
+        self.channel_id = 0
+        self.response = FakeResponse(self)
+        self.followup = FakeFollowup(self)
+        self.started = time.perf_counter()
+        self.first_output = None
+        self.outputs = []
+
+    def record(self, content=None):
+        if self.first_output is None:
+            self.first_output = time.perf_counter() - self.started
+        self.outputs.append(content)
+
+    async def edit_original_response(self, **kwargs):
+        self.record()
+
+
+class FakeChannel:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, content=None, **kwargs):
+        self.sent.append(content)
+
+
+class FakeClient:
+    def __init__(self):
+        self.channel = FakeChannel()
+
+    def get_partial_messageable(self, channel_id):
+        return self.channel
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+# Run `make_call` `iterations` times with at most `concurrency` in flight
+async def run_scenario(name, server, make_call, iterations, concurrency):
+    latencies = []
+    first_outputs = []
+    semaphore = asyncio.Semaphore(concurrency)
+    calls_before = server.total_calls
+
+    async def one():
+        async with semaphore:
+            started = time.perf_counter()
+            first_output = await make_call()
+            latencies.append(time.perf_counter() - started)
+            if first_output is not None:
+                first_outputs.append(first_output)
+
+    wall_started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(iterations)))
+    wall = time.perf_counter() - wall_started
+
+    result = {
+        'scenario': name,
+        'iterations': iterations,
+        'p50': percentile(latencies, 50),
+        'p95': percentile(latencies, 95),
+        'p99': percentile(latencies, 99),
+        'mean': statistics.fmean(latencies),
+        'riot_calls_per_command': (server.total_calls - calls_before) / iterations,
+        'throughput': iterations / wall,
+    }
+    if first_outputs:
+        result['first_message_p50'] = percentile(first_outputs, 50)
+    return result
+
+
+async def invoke(command, **kwargs):
+    # The Discord-side usage throttle would reject a benchmark-sized burst
+    commands.command_usage_times.clear()
+    interaction = FakeInteraction()
+    await command.callback(interaction, **kwargs)
+    return interaction.first_output
+
+
+async def main(args):
+    tmp_dir = tempfile.mkdtemp(prefix='bot-bench-')
+    match_cache.close()
+    match_cache.path = os.path.join(tmp_dir, 'matches.sqlite3')
+    identity_cache.path = os.path.join(tmp_dir, 'accounts.json')
+    warehouse.close()
+    warehouse.path = os.path.join(tmp_dir, 'history.sqlite3')
+    registry.close()
+    registry.path = os.path.join(tmp_dir, 'players.sqlite3')
+    registry.load()
+
+    server = MockRiotServer(latency=args.latency, jitter=args.jitter, rate_429=args.rate_429, rate_5xx=args.rate_5xx)
+    url = await server.start()
+    riot.hosts = {'na1': url, 'americas': url}
+    riot.limiters = {region: RateLimiter(APP_RATE_LIMIT) for region in riot.hosts}
+    await riot.open()
+
+    try:
+        # Identity is warmed at startup in the bot, do the same here
+        account_info = await commands.resolve_player(RIOT_ID)
+        player = TrackedPlayer(account_info['gameName'], account_info['tagLine'], account_info['puuid'], [0])
+        Notifier(Outbox(FakeClient()), bus).subscribe()
+
+        # Each poll is for a different player, so it reaches the mock instead of being answered
+        # from the spectator response cache or coalesced with the previous poll
+        polled_players = itertools.count()
+
+        async def spectator_poll():
+            polled = TrackedPlayer(player.game_name, player.tag_line, f'{player.puuid}-{next(polled_players)}', [0])
+            await poll_player(polled, PlayerState())
+
+        # Cold runs start from an empty warehouse and match cache each time, so they run one at a time
+        cold_runs = itertools.count()
+
+        async def stalkmatches_cold():
+            warehouse.close()
+            warehouse.path = os.path.join(tmp_dir, f'history-cold-{next(cold_runs)}.sqlite3')
+            return await invoke(stalkmatches_command, player=RIOT_ID, count=args.matches)
+
+        results = []
+        match_cache.max_bytes = 0  # Every payload is evicted straight away, so each run downloads
+        results.append(await run_scenario('stalkmatches (cold)', server, stalkmatches_cold, args.iterations, 1))
+        match_cache.max_bytes = MAX_CACHE_BYTES
+        warehouse.close()
+        warehouse.path = os.path.join(tmp_dir, 'history.sqlite3')
+        await invoke(stalkmatches_command, player=RIOT_ID, count=args.matches)
+        results.append(await run_scenario('stalkmatches (warm)', server, lambda: invoke(stalkmatches_command, player=RIOT_ID, count=args.matches), args.iterations, args.concurrency))
+        results.append(await run_scenario('livegame', server, lambda: invoke(livegame_command, player=RIOT_ID), args.iterations, args.concurrency))
+        results.append(await run_scenario('spectator poll', server, spectator_poll, args.iterations, args.concurrency))
+    finally:
+        await riot.close()
+        await server.close()
+        match_cache.close()
+        warehouse.close()
+
+    return results
+
+
+def report(results):
+    print(f"{'scenario':<22}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'1st msg':>9}{'calls':>8}{'cmd/s':>9}")
+    for r in results:
+        first = f"{r['first_message_p50'] * 1000:.1f}" if 'first_message_p50' in r else '-'
+        print(f"{r['scenario']:<22}{r['p50'] * 1000:>9.1f}{r['p95'] * 1000:>9.1f}{r['p99'] * 1000:>9.1f}{first:>9}{r['riot_calls_per_command']:>8.2f}{r['throughput']:>9.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the bot against a local mock Riot API")
+    parser.add_argument('--iterations', type=int, default=100)
+    parser.add_argument('--concurrency', type=int, default=5)
+    parser.add_argument('--matches', type=int, default=3, help="Matches requested per /stalkmatches")
+    parser.add_argument('--latency', type=float, default=0.05, help="Mock Riot response latency in seconds")
+    parser.add_argument('--jitter', type=float, default=0.02)
+    parser.add_argument('--rate-429', type=float, default=0.0, help="Fraction of Riot calls answered with 429")
+    parser.add_argument('--rate-5xx', type=float, default=0.0, help="Fraction of Riot calls answered with 503")
+    parser.add_argument('--json', help="Also write the results to this file")
+    parser.add_argument('--max-p95', type=float, help="Fail if any scenario's p95 latency exceeds this many seconds")
+    args = parser.parse_args()
+
+    results = asyncio.run(main(args))
+    report(results)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+    if args.max_p95 is not None and any(r['p95'] > args.max_p95 for r in results):
+        print(f"p95 budget of {args.max_p95 * 1000:.0f} ms exceeded")
+        sys.exit(1)
@@ -0,0 +1,50 @@
+# Benchmark of decoding match-v5 payloads with each available decoder: the stdlib json the
+# client used to go through, orjson, msgspec into plain objects and msgspec straight into the
+# typed schema from json_codec. Payloads are the recorded fixtures when present, otherwise the
+# generated ones (which carry the same ~140 stats per participant as real matches).
+#
+# Run from the repository root: python -m benchmarks.bench_decode --payloads 200
+import argparse
+import json
+import time
+
+import json_codec
+from benchmarks import fixtures
+from match_view import parse_match
+
+
+def decoders():
+    found = {'json': json.loads}
+    if json_codec.orjson is not None:
+        found['orjson'] = json_codec.orjson.loads
+    if json_codec.msgspec is not None:
+        found['msgspec'] = json_codec.msgspec.json.decode
+        typed = json_codec.SCHEMAS['match-v5.match']
+        found['msgspec typed'] = lambda body: json_codec.msgspec.to_builtins(typed.decode(body))
+    return found
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark JSON decoders on match-v5 payloads")
+    parser.add_argument('--payloads', type=int, default=200)
+    parser.add_argument('--repeats', type=int, default=5)
+    args = parser.parse_args()
+
+    bodies = [json.dumps(fixtures.match(f'NA1_{5000000000 - i}', 'benchmark')).encode() for i in range(args.payloads)]
+    total_mb = sum(len(body) for body in bodies) / 1e6
+    print(f"{args.payloads} payloads, {total_mb / args.payloads * 1000:.0f} KB each")
+    print(f"{'decoder':<16}{'us/payload':>12}{'MB/s':>9}{'+parse us':>11}{'speedup':>9}")
+
+    baseline = None
+    for name, decode in decoders().items():
+        best = best_parse = float('inf')
+        for _ in range(args.repeats):
+            started = time.perf_counter()
+            payloads = [decode(body) for body in bodies]
+            decoded = time.perf_counter()
+            for payload in payloads:
+                parse_match(payload)
+            best = min(best, decoded - started)
+            best_parse = min(best_parse, time.perf_counter() - started)
+        baseline = baseline or best_parse
+        print(f"{name:<16}{best / args.payloads * 1e6:>12.0f}{total_mb / best:>9.0f}{best_parse / args.payloads * 1e6:>11.0f}{baseline / best_parse:>8.1f}x")
@@ -0,0 +1,92 @@
+# Benchmark of season-scale stats over stored participant rows: the per-match dict walk
+# the commands used to do versus the columnar engine (NumPy when installed, otherwise
+# its pure Python fallback). Both compute per-champion and per-queue StatLines, CS/min
+# percentiles and a rolling 20 game winrate.
+#
+# Run from the repository root: python -m benchmarks.bench_stats --rows 10000 100000
+import argparse
+import random
+import time
+
+import columnar_stats
+from columnar_stats import ParticipantColumns, aggregate, percentiles, rolling_winrate
+from warehouse import StatLine
+
+QUEUE_IDS = [400, 420, 440, 450]
+FORM_WINDOW = 20
+
+
+# Participant rows shaped like the warehouse query, plus the same data as match-v5 style dicts
+def make_rows(count, seed=0):
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        duration = rng.randint(15 * 60, 40 * 60)
+        rows.append((rng.randint(0, 15), rng.randint(0, 12), rng.randint(0, 20), rng.randint(0, duration // 6 + 60),
+                     duration, rng.random() < 0.5, rng.randint(1, 160), rng.choice(QUEUE_IDS), 1700000000000 + i * 60000))
+    return rows
+
+
+def as_dicts(rows):
+    return [
+        {'info': {'gameDuration': duration, 'queueId': queue_id, 'gameCreation': created,
+                  'participants': [{'kills': kills, 'deaths': deaths, 'assists': assists, 'totalMinionsKilled': cs,
+                                    'neutralMinionsKilled': 0, 'win': win, 'championId': champion_id}]}}
+        for kills, deaths, assists, cs, duration, win, champion_id, queue_id, created in rows
+    ]
+
+
+def naive(matches):
+    by_champion, by_queue, cs_per_minute, wins = {}, {}, [], []
+    for match in matches:
+        info = match['info']
+        for participant in info['participants']:
+            cs = participant['totalMinionsKilled'] + participant['neutralMinionsKilled']
+            values = (1, int(participant['win']), participant['kills'], participant['deaths'], participant['assists'], cs, info['gameDuration'])
+            for groups, key in ((by_champion, participant['championId']), (by_queue, info['queueId'])):
+                total = groups.setdefault(key, [0] * 7)
+                for i, value in enumerate(values):
+                    total[i] += value
+            cs_per_minute.append(cs / max(info['gameDuration'] / 60, 1))
+            wins.append(int(participant['win']))
+    champions = {key: StatLine(*total) for key, total in by_champion.items()}
+    queues = {key: StatLine(*total) for key, total in by_queue.items()}
+    cs_per_minute.sort()
+    median = cs_per_minute[len(cs_per_minute) // 2]
+    form = [sum(wins[i - FORM_WINDOW:i]) / FORM_WINDOW * 100 for i in range(FORM_WINDOW, len(wins) + 1)]
+    return champions, queues, median, form
+
+
+def columnar(columns):
+    champions = aggregate(columns, 'champion_id')
+    queues = aggregate(columns, 'queue_id')
+    median, = percentiles(columns.cs_per_minute(), (50,))
+    form = rolling_winrate(columns, FORM_WINDOW)
+    return champions, queues, median, form
+
+
+def best_of(repeats, func, *args):
+    best = float('inf')
+    for _ in range(repeats):
+        started = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the columnar stats engine against a per-dict loop")
+    parser.add_argument('--rows', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--repeats', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"engine: {'numpy' if columnar_stats.np is not None else 'pure python fallback'}")
+    print(f"{'rows':>8}{'naive ms':>11}{'load ms':>10}{'columnar ms':>13}{'speedup':>9}")
+    for count in args.rows:
+        rows = make_rows(count)
+        matches = as_dicts(rows)
+        naive_time, expected = best_of(args.repeats, naive, matches)
+        load_time, columns = best_of(args.repeats, ParticipantColumns.from_rows, rows)
+        columnar_time, result = best_of(args.repeats, columnar, columns)
+        assert result[0] == expected[0] and result[1] == expected[1]
+        print(f"{count:>8}{naive_time * 1000:>11.1f}{load_time * 1000:>10.1f}{columnar_time * 1000:>13.1f}{naive_time / columnar_time:>8.1f}x")
@@ -0,0 +1,157 @@
+# Riot API payloads for the offline benchmarks. Recorded responses dropped into
+# benchmarks/fixtures/ (match.json, live_game.json) are used as templates
+# when present; otherwise payloads shaped like real match-v5 / spectator-v5 responses are
+# generated, padded with the per-participant fields the bot ignores so decode and parse
+# costs stay realistic.
+import copy
+import json
+import os
+import random
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+PLATFORM_ID = 'NA1'
+CHAMPION_IDS = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25]
+FILLER_STATS = 120  # Extra numeric fields per participant, real match-v5 participants carry ~140
+POSITIONS = ['TOP', 'JUNGLE', 'MIDDLE', 'BOTTOM', 'UTILITY']
+FRAME_FILLER_STATS = 25  # championStats / damageStats fields per participant frame
+FRAME_FILLER_EVENTS = 30  # Item, ward and skill events per timeline frame
+
+
+def _load(name):
+    try:
+        with open(os.path.join(FIXTURE_DIR, name), encoding='utf-8') as f:
+            return json.load(f)
+    except OSError:
+        return None
+
+
+def account(game_name, tag_line):
+    return {'puuid': f'puuid-{game_name.lower()}-{tag_line.lower()}', 'gameName': game_name, 'tagLine': tag_line}
+
+
+# Epoch milliseconds a generated match was created, newer ids are more recent
+def game_creation(match_id):
+    return 1700000000000 + (int(match_id.split('_')[1]) - 4990000000) * 1000
+
+
+# The `total` newest match ids, filtered to [start_time, end_time] (epoch seconds) like match-v5
+def match_ids(puuid, start, count, total=100, start_time=None, end_time=None):
+    ids = [f'{PLATFORM_ID}_{5000000000 - i}' for i in range(total)]
+    if start_time is not None:
+        ids = [i for i in ids if game_creation(i) // 1000 >= start_time]
+    if end_time is not None:
+        ids = [i for i in ids if game_creation(i) // 1000 <= end_time]
+    return ids[start:start + count]
+
+
+def _participant(rng, puuid, index, duration):
+    participant = {
+        'puuid': puuid,
+        'participantId': index + 1,
+        'riotIdGameName': puuid,
+        'riotIdTagline': PLATFORM_ID,
+        'summonerName': '',
+        'championId': rng.choice(CHAMPION_IDS),
+        'teamId': 100 if index < 5 else 200,
+        'teamPosition': POSITIONS[index % 5],
+        'win': index < 5,
+        'kills': rng.randint(0, 15),
+        'deaths': rng.randint(0, 12),
+        'assists': rng.randint(0, 20),
+        'totalMinionsKilled': rng.randint(0, duration // 6),
+        'neutralMinionsKilled': rng.randint(0, 60),
+        'summoner1Id': 4,
+        'summoner2Id': rng.choice([7, 11, 12, 14]),
+    }
+    for i in range(FILLER_STATS):
+        participant[f'stat{i}'] = rng.randint(0, 100000)
+    participant['challenges'] = {f'challenge{i}': rng.random() for i in range(FILLER_STATS)}
+    return participant
+
+
+def match(match_id, puuid):
+    rng = random.Random(match_id)
+    template = _load('match.json')
+    if template:
+        payload = copy.deepcopy(template)
+        payload['metadata']['matchId'] = match_id
+        payload['info']['participants'][0]['puuid'] = puuid
+        return payload
+
+    duration = rng.randint(15 * 60, 40 * 60)
+    puuids = [puuid] + [f'{match_id}-player-{i}' for i in range(1, 10)]
+    return {
+        'metadata': {'matchId': match_id, 'participants': puuids},
+        'info': {
+            'gameCreation': game_creation(match_id),
+            'gameDuration': duration,
+            'queueId': rng.choice([400, 420, 440, 450]),
+            'participants': [_participant(rng, p, i, duration) for i, p in enumerate(puuids)],
+            'teams': [
+                {'teamId': team_id, 'bans': [{'championId': rng.choice(CHAMPION_IDS), 'pickTurn': i} for i in range(5)]}
+                for team_id in (100, 200)
+            ],
+        },
+    }
+
+
+def live_game(puuid, game_id=4000000000):
+    template = _load('live_game.json')
+    if template:
+        payload = copy.deepcopy(template)
+        payload['participants'][0]['puuid'] = puuid
+        return payload
+
+    rng = random.Random(game_id)
+    puuids = [puuid] + [f'{game_id}-player-{i}' for i in range(1, 10)]
+    return {
+        'gameId': game_id,
+        'platformId': PLATFORM_ID,
+        'gameQueueConfigId': 420,
+        'gameStartTime': 1700000000000,
+        'gameLength': 600,
+        'participants': [
+            {'puuid': p, 'riotId': f'{p}#{PLATFORM_ID}', 'championId': rng.choice(CHAMPION_IDS), 'teamId': 100 if i < 5 else 200, 'spell1Id': 4, 'spell2Id': 14}
+            for i, p in enumerate(puuids)
+        ],
+        'bannedChampions': [{'championId': rng.choice(CHAMPION_IDS), 'teamId': 100 if i < 5 else 200, 'pickTurn': i + 1} for i in range(10)],
+    }
+
+
+# match-v5 timeline for a generated match: one frame per minute with every participant's
+# totals, plus kill, objective and filler events
+def timeline(match_id):
+    rng = random.Random(f'{match_id}-timeline')
+    minutes = match(match_id, '')['info']['gameDuration'] // 60
+    frames = []
+    for minute in range(minutes + 1):
+        participant_frames = {
+            str(pid): {
+                'participantId': pid,
+                'totalGold': 500 + minute * rng.randint(250, 450),
+                'xp': minute * rng.randint(300, 500),
+                'minionsKilled': minute * rng.randint(4, 9),
+                'jungleMinionsKilled': minute * rng.randint(0, 5),
+                'position': {'x': rng.randint(0, 15000), 'y': rng.randint(0, 15000)},
+                'championStats': {f'stat{i}': rng.randint(0, 5000) for i in range(FRAME_FILLER_STATS)},
+                'damageStats': {f'stat{i}': rng.randint(0, 50000) for i in range(FRAME_FILLER_STATS)},
+            }
+            for pid in range(1, 11)
+        }
+        timestamp = minute * 60000
+        events = [{'type': 'ITEM_PURCHASED', 'participantId': rng.randint(1, 10), 'itemId': rng.randint(1000, 7000), 'timestamp': timestamp + i}
+                  for i in range(FRAME_FILLER_EVENTS)]
+        if minute:
+            killer, victim = rng.sample(range(1, 11), 2)
+            events.append({'type': 'CHAMPION_KILL', 'killerId': killer, 'victimId': victim, 'assistingParticipantIds': rng.sample(range(1, 11), 2), 'timestamp': timestamp + rng.randint(0, 59999)})
+        if minute % 5 == 0 and minute:
+            team_id = rng.choice((100, 200))
+            killer = rng.randint(1, 5) if team_id == 100 else rng.randint(6, 10)
+            events.append({'type': 'ELITE_MONSTER_KILL', 'monsterType': 'DRAGON', 'killerId': killer, 'killerTeamId': team_id, 'assistingParticipantIds': [killer % 10 + 1], 'timestamp': timestamp})
+            events.append({'type': 'BUILDING_KILL', 'buildingType': 'TOWER_BUILDING', 'killerId': killer, 'teamId': 300 - team_id, 'assistingParticipantIds': [], 'timestamp': timestamp})
+        frames.append({'timestamp': timestamp, 'participantFrames': participant_frames, 'events': events})
+    return {
+        'metadata': {'matchId': match_id},
+        'info': {'frameInterval': 60000, 'frames': frames, 'gameId': int(match_id.split('_')[1]),
+                 'participants': [{'participantId': pid, 'puuid': f'{match_id}-player-{pid - 1}'} for pid in range(1, 11)]},
+    }
@@ -0,0 +1,103 @@
+# Local stand-in for the Riot API used by the offline benchmarks. Serves account-v1,
+# match-v5 (ids and details) and spectator-v5 from benchmarks.fixtures with configurable
+# latency, 429s and 5xx errors, and counts every call per endpoint.
+import asyncio
+import random
+from collections import Counter
+
+from aiohttp import web
+
+from benchmarks import fixtures
+
+APP_RATE_LIMIT = '500:1,30000:600'  # Reported in X-App-Rate-Limit so the bot's limiter opens up
+FEATURED_PUUID = fixtures.account('Sourcewalker', 'Faust')['puuid']  # Player placed in every fixture match
+
+
+class MockRiotServer:
+    def __init__(self, latency=0.05, jitter=0.02, rate_429=0.0, rate_5xx=0.0, retry_after=1, in_game=True, seed=0):
+        self.latency = latency  # Seconds added to every response
+        self.jitter = jitter  # Uniform +/- seconds on top of latency
+        self.rate_429 = rate_429  # Fraction of calls answered with 429
+        self.rate_5xx = rate_5xx  # Fraction of calls answered with 503
+        self.retry_after = retry_after
+        self.in_game = in_game  # Whether spectator-v5 reports an active game
+        self.calls = Counter()
+        self.rng = random.Random(seed)
+        self._runner = None
+        self.url = None
+
+        self.app = web.Application()
+        self.app.router.add_get('/riot/account/v1/accounts/by-riot-id/{game_name}/{tag_line}', self.account)
+        self.app.router.add_get('/lol/match/v5/matches/by-puuid/{puuid}/ids', self.match_ids)
+        self.app.router.add_get('/lol/match/v5/matches/{match_id}', self.match)
+        self.app.router.add_get('/lol/match/v5/matches/{match_id}/timeline', self.timeline)
+        self.app.router.add_get('/lol/spectator/v5/active-games/by-summoner/{puuid}', self.live_game)
+
+    async def start(self, host='127.0.0.1', port=0):
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.url = f'http://{host}:{port}'
+        return self.url
+
+    async def close(self):
+        if self._runner:
+            await self._runner.cleanup()
+
+    @property
+    def total_calls(self):
+        return sum(self.calls.values())
+
+    # Shared latency / error injection, returns an error response or None
+    async def _simulate(self, endpoint):
+        self.calls[endpoint] += 1
+        await asyncio.sleep(max(0.0, self.latency + self.rng.uniform(-self.jitter, self.jitter)))
+        headers = {'X-App-Rate-Limit': APP_RATE_LIMIT}
+        roll = self.rng.random()
+        if roll < self.rate_429:
+            headers.update({'Retry-After': str(self.retry_after), 'X-Rate-Limit-Type': 'application'})
+            return web.json_response({'status': {'status_code': 429}}, status=429, headers=headers)
+        if roll < self.rate_429 + self.rate_5xx:
+            return web.json_response({'status': {'status_code': 503}}, status=503, headers=headers)
+        return None
+
+    def _ok(self, payload):
+        return web.json_response(payload, headers={'X-App-Rate-Limit': APP_RATE_LIMIT})
+
+    async def account(self, request):
+        error = await self._simulate('account-v1.by-riot-id')
+        if error:
+            return error
+        return self._ok(fixtures.account(request.match_info['game_name'], request.match_info['tag_line']))
+
+    async def match_ids(self, request):
+        error = await self._simulate('match-v5.ids')
+        if error:
+            return error
+        start = int(request.query.get('start', 0))
+        count = int(request.query.get('count', 20))
+        start_time = int(request.query['startTime']) if 'startTime' in request.query else None
+        end_time = int(request.query['endTime']) if 'endTime' in request.query else None
+        return self._ok(fixtures.match_ids(request.match_info['puuid'], start, count, start_time=start_time, end_time=end_time))
+
+    async def match(self, request):
+        error = await self._simulate('match-v5.match')
+        if error:
+            return error
+        return self._ok(fixtures.match(request.match_info['match_id'], FEATURED_PUUID))
+
+    async def timeline(self, request):
+        error = await self._simulate('match-v5.timeline')
+        if error:
+            return error
+        return self._ok(fixtures.timeline(request.match_info['match_id']))
+
+    async def live_game(self, request):
+        error = await self._simulate('spectator-v5.active-games')
+        if error:
+            return error
+        if not self.in_game:
+            return web.json_response({'status': {'status_code': 404}}, status=404)
+        return self._ok(fixtures.live_game(request.match_info['puuid']))
@@ -1,32 +1,98 @@
 import discord
 from discord import app_commands
 from check_spectator import check_spectator
-from commands import stalkmatches_command, livegame_command#, stalkrank_command only needed w/sql db rank tracking
+from commands import stalkmatches_command, livegame_command, track_command, untrack_command, stalkstats_command, botstats_command, account#, stalkrank_command only needed w/sql db rank tracking
+from riot_client import riot
+from tracking import registry
+from static_data import watch_static_data
+from metrics import metrics, start_metrics_server, log_metrics, monitor_loop_lag, METRICS_PORT
+from worker_pool import cpu_pool
+from events import bus
+from notifier import Notifier
+from outbox import Outbox
+from rank_tracker import RankTracker
+from warehouse import warehouse, sync_history
+from timeline import TimelineAnalyzer
+from sharding import Coordinator, shard_ids_for
+import argparse
 import asyncio
+import os
+import subprocess
+import sys
+
+CHANNEL_ID = """<PUT CHANNEL ID HERE>"""  # Channel the default player's games are announced in
+TIMELINE_ANALYTICS = True  # Post a timeline breakdown (gold/XP/CS diffs, deaths, objectives) after each tracked game
+
+# Set by the launcher when the bot runs as several worker processes (python bot.py --workers N)
+WORKERS = int(os.environ.get('BOT_WORKERS', 1))  # Processes splitting the tracked players and the Riot rate limits
+WORKER_ID = int(os.environ.get('BOT_WORKER_ID', 0))
+SHARDS = int(os.environ.get('BOT_SHARDS', WORKERS))  # Discord gateway shards, dealt round-robin to the workers
 
 # Define bot intents and initialize the client and command tree
 intents = discord.Intents.default()
-client = discord.Client(intents=intents, reconnect=True)
+if WORKERS > 1:
+    client = discord.AutoShardedClient(intents=intents, reconnect=True, shard_count=SHARDS, shard_ids=shard_ids_for(WORKER_ID, WORKERS, SHARDS))
+    coordinator = Coordinator(WORKER_ID)  # Decides which worker polls which player
+else:
+    client = discord.AutoShardedClient(intents=intents, reconnect=True)  # Discord picks the shard count
+    coordinator = None
 tree = app_commands.CommandTree(client)
 
 # Register the commands from other files
 tree.add_command(stalkmatches_command)
 tree.add_command(livegame_command)
+tree.add_command(track_command)
+tree.add_command(untrack_command)
+tree.add_command(stalkstats_command)
+tree.add_command(botstats_command)
 #tree.add_command(stalkrank_command) only needed w/sql db rank tracking
 
 @client.event
 async def on_ready():
-    print(f'\033[32mLogged in as {client.user}\033[0m')
-    if not hasattr(client, 'synced'):
+    print(f'\033[32mLogged in as {client.user} (worker {WORKER_ID}, shards {client.shard_ids})\033[0m')
+    # Commands are global, so only the first worker syncs them and seeds the registry
+    if WORKER_ID == 0 and not hasattr(client, 'synced'):
         await tree.sync()  # Sync commands with Discord
         client.synced = True  # Ensure we don't sync commands again on reconnect
         print("\033[32mCommands synced.\033[0m")
 
-    # Get the channel to send updates to
-    channel = client.get_channel("""<PUT CHANNEL ID HERE>""")
-    
-    # Start the spectator check task
-    client.loop.create_task(check_spectator(channel))
+    # Warm the account cache so the first command doesn't pay for the PUUID lookup
+    account_info = await account()
+
+    # Track the default player in the updates channel if nobody has been tracked yet
+    if account_info and not registry and WORKER_ID == 0:
+        registry.track(account_info['gameName'], account_info['tagLine'], account_info['puuid'], CHANNEL_ID)
+
+    # Start the spectator check task and its event subscribers once, they survive reconnects
+    if not hasattr(client, 'spectator_task'):
+        if coordinator is not None:
+            coordinator.heartbeat()  # Join the hash ring before picking which players to poll
+            client.coordinator_task = client.loop.create_task(coordinator.run())
+        Notifier(Outbox(client), bus).subscribe()
+        RankTracker(bus).subscribe()
+        warehouse.subscribe(bus)
+        if TIMELINE_ANALYTICS:
+            TimelineAnalyzer(bus).subscribe()
+        client.spectator_task = client.loop.create_task(check_spectator(coordinator))
+        client.static_data_task = client.loop.create_task(watch_static_data())
+        client.metrics_task = client.loop.create_task(log_metrics())
+        client.history_task = client.loop.create_task(sync_history(coordinator))
+        client.loop_lag_task = client.loop.create_task(monitor_loop_lag())
+        await start_metrics_server(port=METRICS_PORT + WORKER_ID)
+
+# Record end-to-end command latency, measured from when Discord created the interaction
+@client.event
+async def on_app_command_completion(interaction, command):
+    elapsed = (discord.utils.utcnow() - interaction.created_at).total_seconds()
+    metrics.observe_command(command.name, 'ok', elapsed)
+
+@tree.error
+async def on_app_command_error(interaction, error):
+    elapsed = (discord.utils.utcnow() - interaction.created_at).total_seconds()
+    name = interaction.command.name if interaction.command else 'unknown'
+    metrics.observe_command(name, 'error', elapsed)
+    metrics.error(name)
+    print(f"Error in /{name}: {error}")
 
 @client.event
 async def on_disconnect():
@@ -34,15 +100,49 @@ async def on_disconnect():
 
 # Start the bot & handle any exceptions while trying to reconnect
 async def run_bot():
-    while True:
-        try:
-            await client.start('<PUT DISCORD BOT TOKEN HERE>')
-        except discord.errors.ConnectionClosed:
-            print ("\033[91mConnection lost, trying to reconnect in 5 seconds...\033[0m")
-            await asyncio.sleep(5)
+    # Open the shared Riot client once so every command and the spectator loop reuse its pooled connections
+    await riot.open()
+    registry.load()  # Tracked players, importing a tracked_players.json from older versions once
+    try:
+        while True:
+            try:
+                await client.start('<PUT DISCORD BOT TOKEN HERE>')
+            except discord.errors.ConnectionClosed:
+                print ("\033[91mConnection lost, trying to reconnect in 5 seconds...\033[0m")
+                await asyncio.sleep(5)
+    finally:
+        await riot.close()
+        cpu_pool.shutdown()
+        registry.close()
+        if coordinator is not None:
+            coordinator.close()  # Hand this worker's players to the others right away
 
-if __name__ == "__main__":
+# Start one bot process per worker, each running its own slice of the Discord shards, and wait on them
+def launch_workers(workers, shards):
+    processes = []
+    for worker_id in range(workers):
+        env = {**os.environ, 'BOT_WORKERS': str(workers), 'BOT_WORKER_ID': str(worker_id), 'BOT_SHARDS': str(shards)}
+        processes.append(subprocess.Popen([sys.executable, os.path.abspath(__file__)], env=env))
     try:
-        asyncio.run(run_bot())
+        for process in processes:
+            process.wait()
     except KeyboardInterrupt:
-        print("\033[93mKeyboardInterrupt detected: Bot shutting down gracefully.\033[0m")
+        for process in processes:
+            process.wait()  # The workers got the same interrupt and are shutting down
+        print("\033[93mKeyboardInterrupt detected: All workers shut down.\033[0m")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the bot, optionally as several sharded worker processes")
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--shards', type=int, help="Discord shards across all workers (default: one per worker)")
+    args = parser.parse_args()
+    if args.shards is not None and args.shards < args.workers:
+        parser.error("--shards must be at least --workers, every worker needs a shard")
+
+    if args.workers > 1 and 'BOT_WORKER_ID' not in os.environ:
+        launch_workers(args.workers, args.shards or args.workers)
+    else:
+        try:
+            asyncio.run(run_bot())
+        except KeyboardInterrupt:
+            print("\033[93mKeyboardInterrupt detected: Bot shutting down gracefully.\033[0m")
@@ -1,69 +1,205 @@
-import aiohttp
 import asyncio
+import heapq
+import itertools
+import time
+import datetime
 
-RIOT_API_KEY = '<PERSONAL API KEY HERE>'
-SUMMONER_ID = '<This is where your personal acc summoner ID would go if you want to keep that functionality>'
-BASE_URL = 'https://NA1.api.riotgames.com/lol/spectator/v5/active-games/by-summoner'
-MATCH_URL = 'https://americas.api.riotgames.com/lol/match/v5/matches/by-puuid'
-INTERVAL = 10  # Check every 10 seconds
+from riot_client import riot, SPECTATOR_CACHE_TTL
+from rate_limiter import PRIORITY_BACKGROUND
+from match_history import get_match_details
+from tracking import registry
+from match_view import parse_match, parse_live_game
+from metrics import metrics
+from live_games import live_games
+from events import bus, GamePhase, GameStarted, GameEnded, MatchResult, ResultUnavailable, SpectatorError
 
-# To keep track of Sourcewalker's game state
-game_in_progress = False
-current_game_id = None  # Track the current game ID to query results when it ends
+INTERVAL = 10  # Shortest gap between two polls of the same player
+IDLE_INTERVAL = 300  # Player offline outside their usual hours
+ACTIVE_HOURS_INTERVAL = 60  # Player offline during an hour they often start games
+RECENT_GAME_INTERVAL = 30  # Player just finished a game and may queue again
+RECENT_GAME_WINDOW = 15 * 60  # Seconds after a game during which RECENT_GAME_INTERVAL applies
+IN_GAME_MAX_INTERVAL = 300  # Longest gap between polls while a game is live
+ACTIVE_HOUR_SHARE = 0.1  # An hour counts as active if it holds this share of the player's games
+ESTIMATED_GAME_LENGTH = {450: 20 * 60}  # Typical game length per queue, in seconds
+DEFAULT_GAME_LENGTH = 30 * 60
+RESULT_RETRY_DELAYS = (30, 60, 120, 300, 600)  # Back-off while waiting for match-v5 to publish a finished game
+SPECTATOR_BUDGET_SHARE = 0.5  # Fraction of the na1 app rate limit the background poller may use
 
-async def check_spectator(channel):
-    global game_in_progress, current_game_id
+# Smallest gap between polls of one player so that all tracked players fit in the spectator budget
+def budget_interval(num_players):
+    buckets = riot.limiters['na1'].app_buckets
+    requests_per_second = min(bucket.limit / bucket.window for bucket in buckets) * SPECTATOR_BUDGET_SHARE
+    return max(INTERVAL, num_players / requests_per_second)
 
-    while True:
+# Pick how long to wait before polling a player again based on what they're doing
+def next_poll_delay(player, state, now):
+    if state.in_game:
+        # Poll rarely early in the game, then tighten up as the estimated end approaches
+        elapsed = state.game_length + (now - state.polled_at)
+        remaining = ESTIMATED_GAME_LENGTH.get(state.queue_id, DEFAULT_GAME_LENGTH) - elapsed
+        return min(max(remaining, INTERVAL), IN_GAME_MAX_INTERVAL)
+
+    if state.last_game_end and now - state.last_game_end < RECENT_GAME_WINDOW:
+        return RECENT_GAME_INTERVAL
+
+    total_games = sum(player.play_hours)
+    hour = datetime.datetime.now().hour
+    if total_games and player.play_hours[hour] / total_games >= ACTIVE_HOUR_SHARE:
+        return ACTIVE_HOURS_INTERVAL
+    return IDLE_INTERVAL
+
+# Polls every tracked player's spectator status on an adaptive per-player schedule
+class SpectatorScheduler:
+    def __init__(self, coordinator=None):
+        self.coordinator = coordinator  # When sharded, only the players this worker owns are polled
+        self.schedule = []  # Heap of (due time, tiebreak, puuid)
+        self.scheduled = set()
+        self.counter = itertools.count()
+        self.tasks = set()  # Keep references to in-flight poll tasks
+        self.wakeup = asyncio.Event()
+        registry.on_change(self.wakeup.set)  # Pick up newly tracked players right away
+
+    def push(self, puuid, due):
+        heapq.heappush(self.schedule, (due, next(self.counter), puuid))
+        self.scheduled.add(puuid)
+        self.wakeup.set()
+
+    def spawn(self, coro):
+        task = asyncio.create_task(coro)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    def owns(self, puuid):
+        return self.coordinator is None or self.coordinator.owns(puuid)
+
+    def owned_players(self):
+        return [player for player in registry if self.owns(player.puuid)]
+
+    async def run(self):
+        while True:
+            # Schedule newly tracked players, staggered across the time polling every player once
+            # takes inside the spectator budget, so startup or a bulk /track can't flood the limiter
+            owned = self.owned_players()
+            new_players = [player for player in owned if player.puuid not in self.scheduled]
+            now = time.monotonic()
+            spread = budget_interval(len(owned))
+            for i, player in enumerate(new_players):
+                self.push(player.puuid, now + i * spread / len(new_players))
+
+            # Sleep until the next poll is due or a poll reschedules itself earlier
+            self.wakeup.clear()
+            timeout = self.schedule[0][0] - time.monotonic() if self.schedule else INTERVAL
+            if timeout > 0:
+                try:
+                    await asyncio.wait_for(self.wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            _, _, puuid = heapq.heappop(self.schedule)
+            player = registry.get(puuid)
+            if player is None:  # Untracked while waiting
+                self.scheduled.discard(puuid)
+                continue
+            if not self.owns(puuid):  # The hash ring moved this player to another worker
+                self.scheduled.discard(puuid)
+                self.coordinator.release(puuid)
+                continue
+            if self.coordinator is not None and not self.coordinator.claim(puuid, INTERVAL):
+                # Its previous owner's lease has not run out yet
+                self.push(puuid, time.monotonic() + INTERVAL)
+                continue
+            self.spawn(self.poll(player, registry.states[puuid]))
+
+    async def poll(self, player, state):
+        status = None
         try:
-            async with aiohttp.ClientSession() as session:
-                url = f'{BASE_URL}/{SUMMONER_ID}'
-                headers = {"X-Riot-Token": RIOT_API_KEY}
-                async with session.get(url, headers=headers) as response:
-                    if response.status == 200:
-                        game_data = await response.json()
-
-                        if not game_in_progress:
-                            game_in_progress = True
-                            current_game_id = game_data['gameId']  # Track the game ID
-                            await channel.send(":Meditate: Sourcewalker is in a game now! Monitoring... :YiStare:")
-
-                    elif response.status == 404:
-                        # No active game found, check if a game was in progress previously
-                        if game_in_progress:
-                            game_in_progress = False
-                            await asyncio.sleep(30) # Wait 30 seconds for the API to update
-                            result, deaths = await check_match_result(current_game_id, session)  # Check the result of the game
-                            await channel.send(f":babyrageyi: Sourcewalker's game just ended! {result}")
-                            await channel.send(f":YiLUL: Amount of times Sourcewalker died: {deaths} :copium:")
-                            await track_rank_after_game(current_game_id)
-        except Exception as e:
-            await channel.send(f"An error occurred in the spectator check: {str(e)}")
-
-        # Wait for 10 seconds before checking again
-        await asyncio.sleep(INTERVAL)
-
-async def check_match_result(game_id, session):
+            status = await poll_player(player, state)
+        finally:
+            now = time.monotonic()
+            delay = max(next_poll_delay(player, state, now), budget_interval(len(self.owned_players())))
+            if self.coordinator is not None:
+                self.coordinator.claim(player.puuid, delay)  # Hold the lease until the next poll
+            if status == 200:
+                # /livegame keeps answering from the snapshot this poll published until the next one
+                live_games.hold(player.puuid, delay, ESTIMATED_GAME_LENGTH.get(state.queue_id, DEFAULT_GAME_LENGTH))
+            self.push(player.puuid, now + delay)
+
+# Run the poller, with the result fetcher listening for the games it sees end
+async def check_spectator(coordinator=None):
+    bus.subscribe(GameEnded, fetch_match_result, concurrent=True)
+    await SpectatorScheduler(coordinator).run()
+
+# Poll one player's spectator status and publish any change in their game phase.
+# Returns the spectator-v5 status, or None if the poll failed.
+async def poll_player(player, state):
+    try:
+        status, game_data = await riot.get('na1', f'/lol/spectator/v5/active-games/by-summoner/{player.puuid}', method='spectator-v5.active-games', priority=PRIORITY_BACKGROUND, cache_ttl=SPECTATOR_CACHE_TTL)
+        if status in (200, 404):
+            live_games.publish(player.puuid, game_data)  # /livegame answers from this while it is fresh
+        if status == 200:
+            if state.in_game and game_data['gameId'] != state.game_id:
+                # A short game ended and the next began between two polls, close out the first one
+                end_game(player, state)
+            state.game_length = game_data.get('gameLength', 0)
+            state.polled_at = time.monotonic()
+            if not state.in_game:
+                state.transition(GamePhase.IN_GAME)
+                state.game_id = game_data['gameId']  # Track the game ID
+                state.platform_id = game_data.get('platformId', 'NA1')
+                state.queue_id = game_data.get('gameQueueConfigId')
+                registry.record_game_start(player, datetime.datetime.now().hour)
+
+                game = parse_live_game(game_data)
+                others = tuple(p for p in registry.tracked_in(game) if p is not player)
+                bus.publish(GameStarted(player, game, others))
+
+        elif status == 404:
+            # No active game found, check if a game was in progress previously
+            if state.in_game:
+                end_game(player, state)
+        return status
+    except Exception as e:
+        metrics.error('spectator')
+        bus.publish(SpectatorError(player, str(e)))
+        return None
+
+# Mark the player's current game as over and hand it to the result fetcher
+def end_game(player, state):
+    state.transition(GamePhase.ENDED)
+    state.last_game_end = time.monotonic()
+    bus.publish(GameEnded(player, f"{state.platform_id}_{state.game_id}"))
+
+# Wait for match-v5 to publish a finished game, retrying with back-off, then publish its result
+async def fetch_match_result(event):
+    player = event.player
+    for delay in RESULT_RETRY_DELAYS:
+        await asyncio.sleep(delay)
+        outcome = await check_match_result(player, event.match_id)
+        if outcome:
+            settle_game(player, event.match_id, GamePhase.RESULT_POSTED)
+            bus.publish(MatchResult(player, *outcome))
+            return
+    settle_game(player, event.match_id, GamePhase.IDLE)
+    bus.publish(ResultUnavailable(player, event.match_id))
+
+# Close out a finished game, unless the player was untracked or already started another one
+def settle_game(player, match_id, phase):
+    state = registry.states.get(player.puuid)
+    if state and state.phase is GamePhase.ENDED and f"{state.platform_id}_{state.game_id}" == match_id:
+        state.transition(phase)
+
+# Returns (match, participant) or None if the match isn't available yet
+async def check_match_result(player, match_id):
     try:
-        # Get the most recent match details using the puuid
-        match_url = f'{MATCH_URL}/{SUMMONER_ID}/ids?start=0&count=1'
-        headers = {"X-Riot-Token": RIOT_API_KEY}
-        async with session.get(match_url, headers=headers) as match_response:
-            if match_response.status == 200:
-                match_ids = await match_response.json()
-                if match_ids:
-                    match_id = match_ids[0]
-                    match_detail_url = f'https://americas.api.riotgames.com/lol/match/v5/matches/{match_id}'
-                    async with session.get(match_detail_url, headers=headers) as match_detail_response:
-                        if match_detail_response.status == 200:
-                            match_data = await match_detail_response.json()
-                            for participant in match_data['info']['participants']:
-                                if participant['puuid'] == SUMMONER_ID:
-                                    deaths = participant['deaths']  # Get number of deaths
-                                    if participant['win']:
-                                        return "Sourcewalker's team won!", deaths
-                                    else:
-                                        return "Sourcewalker's team lost!", deaths
-            return "Unable to determine match result.", 0
+        match_data = await get_match_details(match_id, priority=PRIORITY_BACKGROUND)
+        if match_data:
+            match = parse_match(match_data)
+            participant = match.by_puuid.get(player.puuid)
+            if participant:
+                return match, participant
+        return None
     except Exception as e:
-        return f"Error: {str(e)}", 0
+        print(f"Error checking match result: {e}")
+        metrics.error('match_result')
+        return None
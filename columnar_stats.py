@@ -0,0 +1,141 @@
+from array import array
+
+from warehouse import StatLine
+
+try:
+    import numpy as np
+except ImportError:  # Optional, the pure Python path gives the same results, just slower
+    np = None
+
+# Per-participant columns loaded from the warehouse, in query order
+COLUMNS = ('kills', 'deaths', 'assists', 'cs', 'duration', 'win', 'champion_id', 'queue_id', 'game_creation')
+STAT_COLUMNS = ('wins', 'kills', 'deaths', 'assists', 'cs', 'duration')  # Summed into a StatLine, in field order
+
+PARTICIPANT_ROWS_QUERY = (
+    'SELECT p.kills, p.deaths, p.assists, p.cs, m.duration, p.win, p.champion_id, m.queue_id, m.game_creation '
+    'FROM participants p JOIN matches m USING (match_id)'
+)
+
+
+# Stored participant rows as one array per column (NumPy arrays when available, array.array
+# otherwise) so aggregations run over whole columns instead of walking per-match dicts
+class ParticipantColumns:
+    def __init__(self, columns):
+        self.columns = columns
+
+    @classmethod
+    def from_rows(cls, rows):
+        rows = list(rows)
+        if np is not None:
+            table = np.array(rows, dtype=np.int64).reshape(len(rows), len(COLUMNS))
+            return cls({name: table[:, i].copy() for i, name in enumerate(COLUMNS)})
+        return cls({name: array('q', (row[i] for row in rows)) for i, name in enumerate(COLUMNS)})
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def __len__(self):
+        return len(self.columns['kills'])
+
+    # Rows where a boolean mask (from since() or NumPy comparisons) is true, as a new ParticipantColumns
+    def where(self, mask):
+        if np is not None:
+            return ParticipantColumns({name: values[mask] for name, values in self.columns.items()})
+        return ParticipantColumns({name: array('q', (v for v, keep in zip(values, mask) if keep)) for name, values in self.columns.items()})
+
+    # Mask of rows created at or after `since` (epoch milliseconds)
+    def since(self, since):
+        if np is not None:
+            return self.columns['game_creation'] >= since
+        return [created >= since for created in self.columns['game_creation']]
+
+    def cs_per_minute(self):
+        if np is not None:
+            return self['cs'] / np.maximum(self['duration'] / 60, 1)
+        return [cs / max(duration / 60, 1) for cs, duration in zip(self['cs'], self['duration'])]
+
+
+# One player's (or everyone's) stored participant rows as tuples in COLUMNS order, oldest first
+def participant_rows(warehouse, puuid=None, since=None):
+    query = PARTICIPANT_ROWS_QUERY
+    clauses, params = [], []
+    if puuid is not None:
+        clauses.append('p.puuid = ?')
+        params.append(puuid)
+    if since is not None:
+        clauses.append('m.game_creation >= ?')
+        params.append(since)
+    if clauses:
+        query += ' WHERE ' + ' AND '.join(clauses)
+    query += ' ORDER BY m.game_creation'
+    return warehouse.query(query, params).fetchall()
+
+
+# Sum the stat columns per value of `by` ('champion_id' or 'queue_id'), or overall if None.
+# Returns {key: StatLine}, most played first.
+def aggregate(columns, by=None):
+    if not len(columns):
+        return {}
+    if np is not None:
+        if by is None:
+            keys, inverse = np.array([None]), np.zeros(len(columns), dtype=np.int64)
+        else:
+            keys, inverse = np.unique(columns[by], return_inverse=True)
+        games = np.bincount(inverse, minlength=len(keys))
+        sums = [np.bincount(inverse, weights=columns['win' if name == 'wins' else name], minlength=len(keys)) for name in STAT_COLUMNS]
+        lines = {
+            (None if by is None else int(key)): StatLine(int(games[i]), *(int(total[i]) for total in sums))
+            for i, key in enumerate(keys)
+        }
+    else:
+        totals = {}
+        group = columns[by] if by is not None else [None] * len(columns)
+        stat_values = [columns['win' if name == 'wins' else name] for name in STAT_COLUMNS]
+        for i, key in enumerate(group):
+            total = totals.setdefault(key, [0] * (len(STAT_COLUMNS) + 1))
+            total[0] += 1
+            for j, values in enumerate(stat_values, 1):
+                total[j] += values[i]
+        lines = {key: StatLine(*total) for key, total in totals.items()}
+    return dict(sorted(lines.items(), key=lambda item: item[1].games, reverse=True))
+
+
+# Percentiles (0-100) of a sequence of values, linearly interpolated like numpy.percentile
+def percentiles(values, qs):
+    if np is not None:
+        return [float(v) for v in np.percentile(values, qs)] if len(values) else [0.0] * len(qs)
+    ordered = sorted(values)
+    if not ordered:
+        return [0.0] * len(qs)
+    results = []
+    for q in qs:
+        position = (len(ordered) - 1) * q / 100
+        low = int(position)
+        high = min(low + 1, len(ordered) - 1)
+        results.append(ordered[low] + (ordered[high] - ordered[low]) * (position - low))
+    return results
+
+
+# Winrate (0-100) over each trailing window of `window` games, for rows in chronological order
+def rolling_winrate(columns, window):
+    wins = columns['win']
+    if len(wins) < window:
+        return []
+    if np is not None:
+        cumulative = np.concatenate(([0], np.cumsum(wins)))
+        return ((cumulative[window:] - cumulative[:-window]) / window * 100).tolist()
+    results = []
+    total = sum(wins[:window])
+    results.append(total / window * 100)
+    for i in range(window, len(wins)):
+        total += wins[i] - wins[i - window]
+        results.append(total / window * 100)
+    return results
+
+
+# CS/min median and 90th percentile plus the rolling winrate over `window` games, from
+# participant_rows output. Plain data in and out so it can run in a worker pool.
+def form_summary(rows, window):
+    columns = ParticipantColumns.from_rows(rows)
+    cs_median, cs_p90 = percentiles(columns.cs_per_minute(), (50, 90))
+    return cs_median, cs_p90, rolling_winrate(columns, window)
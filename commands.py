@@ -1,78 +1,72 @@
 import discord
 from discord import app_commands
 import datetime
-import aiohttp
 import asyncio
 import time
 from collections import deque
 
-from Utils.getChampionNameByID import get_champion_name
-from Utils.gamemodes import get_queue_type
-from Utils.summonerSpells import get_summoner_spell_name
-from Utils.rankValues import calculate_rank_value
-
-# Fetch Riot API key and Discord bot token from environment variables
-RIOT_API_KEY = '<personal API key>'
-BASE_URL = 'https://americas.api.riotgames.com'
-MATCH_URL = 'https://americas.api.riotgames.com/lol/match/v5/matches/by-puuid'
-SUMMONER_ID = '<your acc summoner ID>'
+from static_data import get_champion, get_queue_type, get_summoner_spell_name
+from riot_client import riot, SPECTATOR_CACHE_TTL
+from warehouse import warehouse, DAY_MS
+from match_history import MatchHistory
+from columnar_stats import participant_rows, form_summary
+from worker_pool import cpu_pool, PoolFull
+from match_cache import match_cache
+from timeline import describe_summary
+from rate_limiter import PRIORITY_COMMAND
+from identity_cache import identity_cache
+from tracking import registry
+from match_view import parse_live_game
+from metrics import metrics
+from live_games import live_games
+
+DEFAULT_RIOT_ID = 'Sourcewalker#Faust'  # Player shown when a command is run without one
 NUM_LATEST_MATCHES = 3
+MAX_MATCHES_PER_PAGE = 10  # Discord allows at most 10 embeds per message
+STATS_SYNC_BATCH = 20  # Most matches /stalkstats downloads before replying, later runs and the background sync pull the rest
+STATS_TOP_CHAMPIONS = 5
+FORM_WINDOW = 20  # Games in the rolling winrate shown by /stalkstats
 
 # Rate limit parameters
 RATE_LIMIT = 10  # Max number of times the command can be used
 TIME_WINDOW = 120  # Time window in seconds (2 minutes)
 command_usage_times = deque(maxlen=RATE_LIMIT)  # Stores timestamps of command usage
 
-# Get account information by in-game name and tagline
-async def account():
-    url = f'{BASE_URL}/riot/account/v1/accounts/by-riot-id/Sourcewalker/Faust'
-    headers = {"X-Riot-Token": RIOT_API_KEY}
-    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
-        async with session.get(url, headers=headers) as response:
-            if response.status == 200:
-                return await response.json()
-            return None
-
-# Get the last 5 match IDs for the account
-async def get_match_ids():
-    account_info = await account()
-    if account_info:
-        puuid = account_info.get('puuid')
-        url = f'{BASE_URL}/lol/match/v5/matches/by-puuid/{puuid}/ids?start=0&count=5'
-        headers = {"X-Riot-Token": RIOT_API_KEY}
-        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    return await response.json()
-                return []
-    return []
-
-# Get match details for a given match ID
-async def get_match_details(match_id):
-    url = f'{BASE_URL}/lol/match/v5/matches/{match_id}'
-    headers = {"X-Riot-Token": RIOT_API_KEY}
-    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
-        async with session.get(url, headers=headers) as response:
-            if response.status == 200:
-                return await response.json()
-            return None
+# Get account information by in-game name and tagline, cached on disk since the PUUID never changes
+async def account(game_name='Sourcewalker', tag_line='Faust'):
+    cached = identity_cache.get(game_name, tag_line)
+    if cached is not None:
+        return cached
+    status, data = await riot.get('americas', f'/riot/account/v1/accounts/by-riot-id/{game_name}/{tag_line}', method='account-v1.by-riot-id')
+    if status == 200:
+        identity_cache.put(game_name, tag_line, data)
+        return data
+    return None
+
+# Resolve a "gamename#tagline" Riot ID to its account info
+async def resolve_player(riot_id):
+    game_name, _, tag_line = riot_id.strip().partition('#')
+    if not game_name or not tag_line:
+        return None
+    return await account(game_name, tag_line)
+
         
-# Get current live game data
-async def get_live_game():
-    url = f'https://na1.api.riotgames.com/lol/spectator/v5/active-games/by-summoner/{SUMMONER_ID}'
-    headers = {"X-Riot-Token": RIOT_API_KEY}
-    
-    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
-        async with session.get(url, headers=headers) as response:
-            if response.status == 200:
-                return await response.json()
-            elif response.status == 404:
-                print("No active game found.")
-                return None
-            else:
-                print(f"Unexpected error: {response.status}")
-                return None
-            return None
+# Get current live game data, from the spectator poller's snapshot when it is fresh
+async def get_live_game(puuid):
+    fresh, data = live_games.get(puuid)
+    if fresh:
+        return data
+    status, data = await riot.get('na1', f'/lol/spectator/v5/active-games/by-summoner/{puuid}', method='spectator-v5.active-games', cache_ttl=SPECTATOR_CACHE_TTL)
+    if status in (200, 404):
+        live_games.publish(puuid, data)
+    if status == 200:
+        return data
+    elif status == 404:
+        print("No active game found.")
+        return None
+    else:
+        print(f"Unexpected error: {status}")
+        return None
 
 # Calculate relative time from game creation timestamp to current time
 def get_relative_time(game_creation_timestamp):
@@ -99,10 +93,131 @@ def get_day_with_suffix(day):
         suffixes = {1: 'st', 2: 'nd', 3: 'rd'}
         return f"{day}{suffixes.get(day % 10, 'th')}"
 
+# Get current date and time for embed footers
+def get_footer_time():
+    now = datetime.datetime.now()
+    month = now.strftime("%B")
+    day_with_suffix = get_day_with_suffix(now.day)
+    nowtime = now.strftime("at %I:%M %p")
+    return f"{month} {day_with_suffix}, {nowtime}"
+
+# Join a team's champions, bolding and underlining only the player's champion name (excluding emoji)
+def format_team(team, player=None):
+    champions = []
+    for participant in team:
+        champion = get_champion(participant.champion_id)
+        champions.append(champion.bold_display if participant is player else champion.display)
+    return ', '.join(champions)
+
+# Build the /stalkmatches embed for one parsed match from the player's point of view
+def build_match_embed(match, player, game_name, tag_line, requested_by, avatar_url):
+    queue_type = get_queue_type(match.queue_id)
+    relative_time = get_relative_time(match.game_creation)
+
+    champion = get_champion(player.champion_id)
+
+    allies, enemies = match.allies_and_enemies(player)
+    game_duration_minutes, game_duration_seconds = divmod(match.duration, 60)
+
+    # Change embed color based on win or loss
+    embed = discord.Embed(
+        title=f"Match Details",
+        color=discord.Color.blue() if player.win else discord.Color.red()
+    )
+    embed.description = f"View full match details on [OP.GG](https://op.gg/summoners/na/{game_name}-{tag_line})"
+
+    # Set the champion icon thumbnail in the embed
+    embed.set_thumbnail(url=champion.icon_url)
+
+    embed.add_field(name="Queue Type", value=queue_type, inline=True)
+    embed.add_field(name="Win/Loss", value="Win" if player.win else "Loss", inline=True)
+    embed.add_field(name="Champion Picked", value=champion.name, inline=True)
+    embed.add_field(name="Duration", value=f"{game_duration_minutes}m {game_duration_seconds}s", inline=False)
+    embed.add_field(name="KDA", value=player.kda, inline=True)
+    embed.add_field(name="CS Total", value=player.cs, inline=True)
+    embed.add_field(name="CS/min", value=f"{player.cs_per_minute:.2f}", inline=True)
+    embed.add_field(name="Ally Champions", value=format_team(allies, player), inline=False)
+    embed.add_field(name="Enemy Champions", value=format_team(enemies), inline=True)
+    embed.add_field(name="Time Ago", value=relative_time, inline=False)
+
+    # Only shown once the post-game stage has summarized the timeline, never fetched here
+    timeline_summary = match_cache.get_timeline_summary(match.match_id)
+    if timeline_summary and player.puuid in timeline_summary:
+        embed.add_field(name="Game Breakdown", value=describe_summary(timeline_summary[player.puuid]), inline=False)
+
+    embed.set_footer(text=f"Requested by {requested_by} • {get_footer_time()} ", icon_url=avatar_url)
+    return embed
+
+# Post matches [start, start + count) of a history. Matches already in the warehouse are sent at
+# once; the rest are downloaded (and stored) only for this page, each edited into the same message
+# in newest-first order as it arrives. Returns False if none of the matches could be shown.
+async def send_match_page(interaction, history, start, count, account_info):
+    game_name, tag_line, puuid = account_info['gameName'], account_info['tagLine'], account_info['puuid']
+    match_ids = await history.get_ids(start, count)
+    embeds = {}
+    message = None
+
+    # Add a match's embed, returning False if the player isn't in it
+    def add(match):
+        match_player = match.by_puuid.get(puuid) if match else None
+        if match_player:
+            embeds[match.match_id] = build_match_embed(match, match_player, game_name, tag_line, interaction.user.name, interaction.user.avatar.url)
+        return match_player is not None
+
+    async def post():
+        nonlocal message
+        ordered = [embeds[match_id] for match_id in match_ids if match_id in embeds]
+        if message is None:
+            message = await interaction.followup.send(embeds=ordered, wait=True)
+        else:
+            await message.edit(embeds=ordered)
+
+    stored = warehouse.matches_by_id(match_ids)
+    for match in stored.values():
+        add(match)
+    if embeds:
+        await post()
+
+    missing = [match_id for match_id in match_ids if match_id not in stored]
+    for next_match in asyncio.as_completed([warehouse.fetch_match(match_id, PRIORITY_COMMAND) for match_id in missing]):
+        if add(await next_match):
+            await post()
+
+    if message is None:
+        return False
+
+    # Offer the next page if the history has more
+    if not history.exhausted or len(history.ids) > start + count:
+        await message.edit(view=MatchHistoryView(history, start + count, count, account_info))
+    return True
+
+
+# "Show more" button that pulls the next page of a player's history, reusing the ids already fetched
+class MatchHistoryView(discord.ui.View):
+    def __init__(self, history, start, count, account_info):
+        super().__init__(timeout=300)
+        self.history = history
+        self.start = start
+        self.count = count
+        self.account_info = account_info
+
+    @discord.ui.button(label="Show more", style=discord.ButtonStyle.secondary)
+    async def show_more(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await interaction.response.defer()
+        await interaction.edit_original_response(view=None)
+        try:
+            if not await send_match_page(interaction, self.history, self.start, self.count, self.account_info):
+                await interaction.followup.send("No more matches found.", ephemeral=True)
+        except Exception as e:
+            print(f"Error in stalkmatches show more: {e}")
+            metrics.error('stalkmatches')
+            await interaction.followup.send("An error occurred while processing the command.", ephemeral=True)
+
 
 # Slash command to fetch and display latest match history with rate limiting
-@app_commands.command(name="stalkmatches", description="Stalk Sourcewalker's latest match history and see what he's up to")
-async def stalkmatches_command(interaction: discord.Interaction):
+@app_commands.command(name="stalkmatches", description="Stalk a player's latest match history and see what they're up to")
+@app_commands.describe(player="Riot ID as name#tag (defaults to Sourcewalker#Faust)", count="Number of matches to show")
+async def stalkmatches_command(interaction: discord.Interaction, player: str = DEFAULT_RIOT_ID, count: app_commands.Range[int, 1, MAX_MATCHES_PER_PAGE] = NUM_LATEST_MATCHES):
     current_time = time.time()
 
     # Remove timestamps older than TIME_WINDOW
@@ -114,137 +229,22 @@ async def stalkmatches_command(interaction: discord.Interaction):
         # Add the current timestamp to the deque
         command_usage_times.append(current_time)
 
+        # Acknowledge right away so slow Riot responses can't run past Discord's 3 second deadline
+        await interaction.response.defer(thinking=True)
+
         try:
-            match_ids = await get_match_ids()
-            if match_ids:
-                # Retrieve match details concurrently for each match ID
-                tasks = [get_match_details(match_id) for match_id in match_ids]
-                match_details_list = await asyncio.gather(*tasks)
-                match_details_list = [details for details in match_details_list if details]
-
-                # Sort matches by game creation time (newest first)
-                match_details_list.sort(key=lambda match: match['info']['gameCreation'], reverse=True)
-                latest_match_details = match_details_list[:NUM_LATEST_MATCHES]
-
-                if latest_match_details:
-                    message = f"Latest 3 matches for Sourcewalker:\n"
-                    embeds = []
-                    for match in latest_match_details:
-                        # Get relative time
-                        relative_time = get_relative_time(match['info']['gameCreation'])
-
-                        # Get queue type
-                        queue_type = get_queue_type(match['info']['queueId'])
-                        participant_id = next((p['participantId'] for p in match['info']['participants'] if p['summonerName'] == 'Sourcewalker'), None)
-                        if not participant_id:
-                            await interaction.response.send_message("Sourcewalker not found in the match.")
-                            return
-                        
-                       # Get Sourcewalker's champion ID and name with emoji
-                        champion_id = next(p['championId'] for p in match['info']['participants'] if p['participantId'] == participant_id)
-                        champion_name_with_emoji = get_champion_name(champion_id)
-
-                        # Split the champion emoji and name
-                        split_result = champion_name_with_emoji.split(' ', 1)
-                        if len(split_result) == 2:
-                            emoji, actual_champion_name = split_result
-                        else:
-                            actual_champion_name = split_result[0]
-
-                        # Get Win/Loss
-                        win = next(p['win'] for p in match['info']['participants'] if p['participantId'] == participant_id)
-                        result = "Win" if win else "Loss"
-
-                        # Get enemy and ally champions
-                        source_team_id = next((p['teamId'] for p in match['info']['participants'] if p['summonerName'] == 'Sourcewalker'), None)
-                        if source_team_id is None:
-                            await interaction.response.send_message("Sourcewalker not found in the match.")
-                            return
-
-                        ally_champions = []
-                        enemy_champions = []
-
-                        # Loop through participants to gather ally and enemy champions
-                        for participant in match['info']['participants']:
-                            champ_name_with_emoji = get_champion_name(participant['championId'])
-                            if participant['teamId'] == source_team_id:
-                                if participant['summonerName'] == 'Sourcewalker':
-                                    # Bold and underline only Sourcewalker's champion name (excluding emoji)
-                                    emoji, champ_name = champ_name_with_emoji.split(' ', 1)
-                                    formatted_champion = f"{emoji} __**{champ_name}**__"
-                                    ally_champions.append(formatted_champion)
-                                else:
-                                    ally_champions.append(champ_name_with_emoji)
-                            else:
-                                enemy_champions.append(champ_name_with_emoji)
-
-                        # Join ally and enemy champions as strings
-                        ally_champions_str = ', '.join(ally_champions)
-                        enemy_champions_str = ', '.join(enemy_champions)
-
-                        # Get CS total and CS per minute
-                        total_minions_killed = next((p['totalMinionsKilled'] for p in match['info']['participants'] if p['participantId'] == participant_id), 0)
-                        neutral_minions_killed = next((p['neutralMinionsKilled'] for p in match['info']['participants'] if p['participantId'] == participant_id), 0)
-                        cs_total = total_minions_killed + neutral_minions_killed
-
-                        game_duration_seconds = match['info']['gameDuration']
-                        game_duration_minutes, game_duration_seconds = divmod(game_duration_seconds, 60)
-
-                        cs_per_minute = cs_total / (game_duration_minutes if game_duration_minutes > 0 else 1)
-
-                        # Get KDA
-                        participant = next(p for p in match['info']['participants'] if p['participantId'] == participant_id)
-                        kills = participant['kills']
-                        deaths = participant['deaths']
-                        assists = participant['assists']
-                        kda = f"{kills}/{deaths}/{assists}"
-
-                        # Change embed color based on win or loss
-                        embed_color = discord.Color.blue() if win else discord.Color.red()
-
-                        # Get the user who sent the command
-                        requested_by = interaction.user.name
-                        avatar_url = interaction.user.avatar.url
-
-                        # Get current date and time for footer
-                        now = datetime.datetime.now()
-                        month = now.strftime("%B")
-                        day_with_suffix = get_day_with_suffix(now.day)
-                        nowtime = now.strftime("at %I:%M %p")
-                        formatted_time = f"{month} {day_with_suffix}, {nowtime}"
-
-                        # Assemble message
-                        embed = discord.Embed(
-                            title=f"Match Details",
-                            color=embed_color
-                        )
-                        embed.description = f"View full match details on [OP.GG](https://op.gg/summoners/na/Sourcewalker-Faust)"
-
-                        # Set the champion icon thumbnail in the embed
-                        embed.set_thumbnail(url=f"https://cdn.communitydragon.org/latest/champion/{champion_id}/square")
-
-                        embed.add_field(name="Queue Type", value=queue_type, inline=True)
-                        embed.add_field(name="Win/Loss", value=result, inline=True)
-                        embed.add_field(name="Champion Picked", value=actual_champion_name, inline=True)
-                        embed.add_field(name="Duration", value=f"{game_duration_minutes}m {game_duration_seconds}s", inline=False)
-                        embed.add_field(name="KDA", value=kda, inline=True)
-                        embed.add_field(name="CS Total", value=cs_total, inline=True)
-                        embed.add_field(name="CS/min", value=f"{cs_per_minute:.2f}", inline=True)
-                        embed.add_field(name="Ally Champions", value=ally_champions_str, inline=False)
-                        embed.add_field(name="Enemy Champions", value=enemy_champions_str, inline=True)
-                        embed.add_field(name="Time Ago", value=relative_time, inline=False)
-
-                        embed.set_footer(text=f"Requested by {requested_by} • {formatted_time} ", icon_url=avatar_url)
-
-                        embeds.append(embed)
-
-                    await interaction.response.send_message(embeds=embeds)
-                else:
-                    await interaction.response.send_message("No match details found.")
-            else:
-                await interaction.response.send_message("Sourcewalker was not found. Stuck in plat probably")
+            account_info = await resolve_player(player)
+            if not account_info:
+                await interaction.followup.send(f"{player} was not found. Stuck in plat probably")
+                return
+
+            # One ids call, then details only for displayed matches the warehouse doesn't hold yet
+            history = MatchHistory(account_info['puuid'], priority=PRIORITY_COMMAND)
+            if not await send_match_page(interaction, history, 0, count, account_info):
+                await interaction.followup.send(f"{account_info['gameName']} has no match history.")
         except Exception as e:
-            print(f"Error: {e}")
+            print(f"Error in stalkmatches: {e}")
+            metrics.error('stalkmatches')
             await interaction.followup.send("An error occurred while processing the command.", ephemeral=True)
     else:
         # Deny the command if rate limit is reached
@@ -252,101 +252,179 @@ async def stalkmatches_command(interaction: discord.Interaction):
 
 
 # Slash command to fetch and display live game stats
-@app_commands.command(name="livegame", description="Get live stats of Sourcewalker's current game")
-async def livegame_command(interaction: discord.Interaction):
+@app_commands.command(name="livegame", description="Get live stats of a player's current game")
+@app_commands.describe(player="Riot ID as name#tag (defaults to Sourcewalker#Faust)")
+async def livegame_command(interaction: discord.Interaction, player: str = DEFAULT_RIOT_ID):
     try:
-        game_data = await get_live_game()
+        account_info = await resolve_player(player)
+        if not account_info:
+            await interaction.response.send_message(f"{player} was not found.", ephemeral=True)
+            return
+        game_name = account_info['gameName']
+
+        game_data = await get_live_game(account_info['puuid'])
         
         if game_data:
-            participants = game_data['participants']
+            game = parse_live_game(game_data)
 
-            # Find Sourcewalker in the participants list
-            sourcewalker_data = next((p for p in participants if p.get('riotId', '').lower() == 'sourcewalker#faust'), None)
+            # Find the player in the participants list
+            player_data = game.by_puuid.get(account_info['puuid'])
             
-            if not sourcewalker_data:
-                await interaction.response.send_message("Sourcewalker is not in the current game.")
+            if not player_data:
+                await interaction.response.send_message(f"{game_name} is not in the current game.")
                 return
 
             # Get queue type and game duration
-            queue_type = get_queue_type(game_data['gameQueueConfigId'])
-            game_duration = game_data['gameLength'] // 60  # Convert seconds to minutes
+            queue_type = get_queue_type(game.queue_id)
+            game_duration = game.duration // 60  # Convert seconds to minutes
 
             # Get champion played
-            champion_id = sourcewalker_data['championId']
-            champion_name = get_champion_name(champion_id)
+            champion = get_champion(player_data.champion_id)
 
             # Get summoner spells
-            spell1_id = sourcewalker_data['spell1Id']
-            spell2_id = sourcewalker_data['spell2Id']
-            spell_1_emoji, spell_1_name = get_summoner_spell_name(spell1_id)
-            spell_2_emoji, spell_2_name = get_summoner_spell_name(spell2_id)
+            spell_1_emoji, spell_1_name = get_summoner_spell_name(player_data.spell1_id)
+            spell_2_emoji, spell_2_name = get_summoner_spell_name(player_data.spell2_id)
 
             # Get enemy and ally champions
-            source_team_id = sourcewalker_data['teamId']
-            ally_champions = []
-            enemy_champions = []
-
-            for participant in participants:
-                champ_name_with_emoji = get_champion_name(participant['championId'])
-                if participant['teamId'] == source_team_id:
-                    if participant['riotId'] == 'Sourcewalker#Faust':
-                        # Bold and underline only Sourcewalker's champion name (excluding emoji)
-                        emoji, champ_name = champ_name_with_emoji.split(' ', 1)
-                        formatted_champion = f"{emoji} __**{champ_name}**__"
-                        ally_champions.append(formatted_champion)
-                    else:
-                        ally_champions.append(champ_name_with_emoji)
-                else:
-                    enemy_champions.append(champ_name_with_emoji)
-
-            # Join ally and enemy champions as strings
-            ally_champions_str = ', '.join(ally_champions)
-            enemy_champions_str = ', '.join(enemy_champions)
+            allies, enemies = game.allies_and_enemies(player_data)
+            ally_champions_str = format_team(allies, player_data)
+            enemy_champions_str = format_team(enemies)
 
             # Get banned champions
-            banned_champions = game_data.get('bannedChampions', [])
-            if banned_champions:
-                banned_champions_emojis = []
-                for ban in banned_champions:
-                    champion_emoji = get_champion_name(ban['championId']).split(' ')[0]
-                    banned_champions_emojis.append(champion_emoji)
-                
-                banned_champs_str = ' | '.join(banned_champions_emojis)
+            if game.banned_champion_ids:
+                banned_champs_str = ' | '.join(get_champion(champion_id).emoji for champion_id in game.banned_champion_ids)
             else:
                 banned_champs_str = "None"
 
-            # Get requestor name and pfp
-            requested_by = interaction.user.name
-            avatar_url = interaction.user.avatar.url
-
-            # Get current date and time for footer
-            now = datetime.datetime.now()
-            month = now.strftime("%B")
-            day_with_suffix = get_day_with_suffix(now.day)
-            nowtime = now.strftime("at %I:%M %p")
-            formatted_time = f"{month} {day_with_suffix}, {nowtime}"
-
             # Embed message
             embed = discord.Embed(
-                title="Live Game Stats for Sourcewalker",
+                title=f"Live Game Stats for {game_name}",
                 description=f"Queue Type: {queue_type}",
                 color=discord.Color.blue()
             )
-            embed.set_thumbnail(url=f"https://cdn.communitydragon.org/latest/champion/{champion_id}/square")
+            embed.set_thumbnail(url=champion.icon_url)
 
-            embed.add_field(name="Champion Picked", value=champion_name, inline=True)
+            embed.add_field(name="Champion Picked", value=champion.display, inline=True)
             embed.add_field(name="Summoner Spells", value=f"{spell_1_emoji} {spell_1_name} **|** {spell_2_emoji} {spell_2_name}", inline=True)
             embed.add_field(name="Game Duration", value=f"{game_duration} minutes", inline=True)
             embed.add_field(name="Ally Champions", value=ally_champions_str, inline=False)
             embed.add_field(name="Enemy Champions", value=enemy_champions_str, inline=False)
             embed.add_field(name="Banned Champions", value=banned_champs_str, inline=False)
 
-            embed.set_footer(text=f"Requested by {requested_by} • {formatted_time} ", icon_url=avatar_url)
+            embed.set_footer(text=f"Requested by {interaction.user.name} • {get_footer_time()} ", icon_url=interaction.user.avatar.url)
             
             await interaction.response.send_message(embed=embed)
 
         else:
-            await interaction.response.send_message("Sourcewalker is not currently in a live game.", ephemeral=True)
+            await interaction.response.send_message(f"{game_name} is not currently in a live game.", ephemeral=True)
 
     except Exception as e:
+        print(f"Error in livegame: {e}")
+        metrics.error('livegame')
         await interaction.response.send_message(f"An error occurred while processing the command: {str(e)}", ephemeral=True)
+
+
+
+# Slash command to start posting a player's games in this channel
+@app_commands.command(name="track", description="Announce a player's games in this channel")
+@app_commands.describe(player="Riot ID as name#tag")
+async def track_command(interaction: discord.Interaction, player: str):
+    account_info = await resolve_player(player)
+    if not account_info:
+        await interaction.response.send_message(f"{player} was not found.", ephemeral=True)
+        return
+
+    registry.track(account_info['gameName'], account_info['tagLine'], account_info['puuid'], interaction.channel_id)
+    await interaction.response.send_message(f"Now tracking {account_info['gameName']}#{account_info['tagLine']} in this channel.")
+
+
+# Slash command to stop tracking a player in this channel; other channels tracking them are unaffected
+@app_commands.command(name="untrack", description="Stop announcing a player's games in this channel")
+@app_commands.describe(player="Riot ID as name#tag")
+async def untrack_command(interaction: discord.Interaction, player: str):
+    tracked = registry.find(player)
+    if not tracked or not registry.untrack(tracked.puuid, interaction.channel_id):
+        await interaction.response.send_message(f"{player} is not being tracked in this channel.", ephemeral=True)
+        return
+
+    await interaction.response.send_message(f"Stopped tracking {tracked.riot_id} in this channel.")
+
+
+# Calendar date of an epoch-ms timestamp, e.g. "Mar 04, 2025"
+def format_date(timestamp_ms):
+    return datetime.datetime.fromtimestamp(timestamp_ms / 1000).strftime("%b %d, %Y")
+
+
+# One line of aggregate stats for the /stalkstats embed
+def format_stat_line(stats):
+    return f"{stats.games} games • {stats.winrate:.0f}% WR • {stats.kda:.2f} KDA • {stats.cs_per_minute:.1f} CS/min • {stats.deaths_per_game:.1f} deaths"
+
+
+# Slash command showing a player's aggregate stats by champion and queue from the local warehouse
+@app_commands.command(name="stalkstats", description="See a player's winrate, KDA and CS/min by champion and queue")
+@app_commands.describe(player="Riot ID as name#tag (defaults to Sourcewalker#Faust)", window="Only count games from this period")
+@app_commands.choices(window=[
+    app_commands.Choice(name="Last 7 days", value=7),
+    app_commands.Choice(name="Last 30 days", value=30),
+    app_commands.Choice(name="All stored games", value=0),
+])
+async def stalkstats_command(interaction: discord.Interaction, player: str = DEFAULT_RIOT_ID, window: app_commands.Choice[int] = None):
+    await interaction.response.defer(thinking=True)
+    try:
+        account_info = await resolve_player(player)
+        if not account_info:
+            await interaction.followup.send(f"{player} was not found.")
+            return
+        puuid = account_info['puuid']
+        days = window.value if window and window.value else None
+
+        # Pick up the oldest games since the last sync, the totals themselves are kept up to date at ingest
+        await warehouse.sync_player(puuid, batch=STATS_SYNC_BATCH, priority=PRIORITY_COMMAND)
+        total = warehouse.player_stats(puuid, days=days).get(None)
+        if not total:
+            await interaction.followup.send(f"No stored games for {account_info['gameName']} in that period.")
+            return
+
+        by_champion = warehouse.player_stats(puuid, 'champion_id', days)
+        by_queue = warehouse.player_stats(puuid, 'queue_id', days)
+
+        # Say which games the numbers cover, the warehouse may not hold the whole window yet
+        games, oldest, newest = warehouse.stored_range(puuid, days)
+        coverage = f"Based on {games} stored games from {format_date(oldest)} to {format_date(newest)}"
+        state = warehouse.sync_state(puuid)
+        if state and not state.complete and (days is None or state.oldest > time.time() * 1000 - days * DAY_MS):
+            coverage += " (older games not fetched yet)"
+
+        embed = discord.Embed(
+            title=f"Stats for {account_info['gameName']}#{account_info['tagLine']}",
+            description=f"{window.name if window else 'All stored games'}\n{format_stat_line(total)}\n{coverage}",
+            color=discord.Color.blue()
+        )
+        champion_lines = [f"{get_champion(champion_id).display}: {format_stat_line(stats)}" for champion_id, stats in list(by_champion.items())[:STATS_TOP_CHAMPIONS]]
+        embed.add_field(name="Top Champions", value="\n".join(champion_lines)[:1024], inline=False)
+        queue_lines = [f"{get_queue_type(queue_id)}: {format_stat_line(stats)}" for queue_id, stats in by_queue.items()]
+        embed.add_field(name="By Queue", value="\n".join(queue_lines)[:1024], inline=False)
+
+        since = int(time.time() * 1000) - days * DAY_MS if days else None
+        # The row query is indexed and stays on the loop, the array work goes to the worker pool
+        cs_median, cs_p90, form = await cpu_pool.run(form_summary, participant_rows(warehouse, puuid, since), FORM_WINDOW)
+        form_line = f"{form[-1]:.0f}% WR over the last {FORM_WINDOW} games (best {max(form):.0f}%, worst {min(form):.0f}%)\n" if form else ""
+        embed.add_field(name="Form", value=f"{form_line}CS/min median {cs_median:.1f}, top 10% {cs_p90:.1f}", inline=False)
+        embed.set_footer(text=f"Requested by {interaction.user.name} • {get_footer_time()} ", icon_url=interaction.user.avatar.url)
+        await interaction.followup.send(embed=embed)
+    except PoolFull:
+        await interaction.followup.send("The bot is busy crunching numbers, try again in a moment.", ephemeral=True)
+    except Exception as e:
+        print(f"Error in stalkstats: {e}")
+        metrics.error('stalkstats')
+        await interaction.followup.send("An error occurred while processing the command.", ephemeral=True)
+
+
+# Admin slash command showing Riot call latency, cache hit rates and command timings
+@app_commands.command(name="botstats", description="Show the bot's Riot API and command statistics")
+@app_commands.default_permissions(administrator=True)
+async def botstats_command(interaction: discord.Interaction):
+    uptime = datetime.timedelta(seconds=int(time.time() - metrics.started))
+    embed = discord.Embed(title="Bot Stats", description="\n".join(metrics.summary_lines()), color=discord.Color.blue())
+    embed.set_footer(text=f"Uptime {uptime} • {get_footer_time()}")
+    await interaction.response.send_message(embed=embed, ephemeral=True)
@@ -0,0 +1,137 @@
+import asyncio
+from dataclasses import dataclass
+from enum import Enum
+
+from metrics import metrics
+
+SUBSCRIBER_QUEUE_SIZE = 100  # Events buffered per subscriber before the oldest are dropped
+
+
+# Lifecycle of one tracked player's game, driven by the spectator poller
+class GamePhase(Enum):
+    IDLE = 'idle'
+    IN_GAME = 'in_game'
+    ENDED = 'ended'  # Left the spectator endpoint, result not known yet
+    RESULT_POSTED = 'result_posted'
+
+
+ALLOWED_TRANSITIONS = {
+    GamePhase.IDLE: {GamePhase.IN_GAME},
+    GamePhase.IN_GAME: {GamePhase.ENDED},
+    GamePhase.ENDED: {GamePhase.RESULT_POSTED, GamePhase.IDLE, GamePhase.IN_GAME},
+    GamePhase.RESULT_POSTED: {GamePhase.IN_GAME, GamePhase.IDLE},
+}
+
+
+# Events published on the bus. Each carries the TrackedPlayer it is about.
+@dataclass(frozen=True, slots=True)
+class GameStarted:
+    player: object
+    game: object  # MatchView parsed from the spectator payload
+    other_tracked: tuple  # Other TrackedPlayers in the same game
+
+
+@dataclass(frozen=True, slots=True)
+class GameEnded:
+    player: object
+    match_id: str
+
+
+@dataclass(frozen=True, slots=True)
+class MatchResult:
+    player: object
+    match: object  # MatchView of the finished match
+    participant: object  # The player's ParticipantView in it
+
+
+@dataclass(frozen=True, slots=True)
+class ResultUnavailable:
+    player: object
+    match_id: str
+
+
+@dataclass(frozen=True, slots=True)
+class RankChanged:
+    player: object
+    queue_id: int
+    before: dict  # league-v4 entry before the game, None if unranked
+    after: dict
+
+
+@dataclass(frozen=True, slots=True)
+class TimelineReady:
+    player: object
+    match_id: str
+    summary: dict  # The player's entry from timeline.summarize
+
+
+@dataclass(frozen=True, slots=True)
+class SpectatorError:
+    player: object
+    error: str
+
+
+# In-process publish/subscribe bus. Every subscriber gets its own bounded queue and worker,
+# so publishing never waits and a slow or failing subscriber only delays itself.
+class EventBus:
+    def __init__(self):
+        self._subscribers = {}  # Event type -> list of subscriptions
+
+    # Call `handler(event)` for every published event of `event_type`. With concurrent=True
+    # each event is handled in its own task (for handlers that wait a long time, like retries).
+    def subscribe(self, event_type, handler, concurrent=False):
+        subscription = Subscription(handler, concurrent)
+        self._subscribers.setdefault(event_type, []).append(subscription)
+        return subscription
+
+    def unsubscribe(self, event_type, subscription):
+        self._subscribers.get(event_type, []).remove(subscription)
+        subscription.close()
+
+    def publish(self, event):
+        for subscription in self._subscribers.get(type(event), ()):
+            subscription.offer(event)
+
+
+class Subscription:
+    def __init__(self, handler, concurrent):
+        self.handler = handler
+        self.concurrent = concurrent
+        self.queue = asyncio.Queue(SUBSCRIBER_QUEUE_SIZE)
+        self.worker = None
+        self.tasks = set()
+
+    def offer(self, event):
+        if self.worker is None:
+            self.worker = asyncio.create_task(self._run())
+        if self.queue.full():
+            self.queue.get_nowait()  # Drop the oldest rather than block the publisher
+            metrics.error('event_dropped')
+        self.queue.put_nowait(event)
+
+    async def _handle(self, event):
+        try:
+            await self.handler(event)
+        except Exception as e:
+            print(f"Error in {getattr(self.handler, '__name__', self.handler)} handling {type(event).__name__}: {e}")
+            metrics.error('event_subscriber')
+
+    async def _run(self):
+        while True:
+            event = await self.queue.get()
+            if self.concurrent:
+                task = asyncio.create_task(self._handle(event))
+                self.tasks.add(task)
+                task.add_done_callback(self.tasks.discard)
+            else:
+                await self._handle(event)
+
+    def close(self):
+        if self.worker:
+            self.worker.cancel()
+        for task in self.tasks:
+            task.cancel()
+
+
+# Shared bus the spectator poller publishes to
+bus = EventBus()
@@ -1,349 +0,0 @@
-champion_mapping = {
-    1: 'Annie',
-    2: 'Olaf',
-    3: 'Galio',
-    4: 'Twisted Fate',
-    5: 'Xin Zhao',
-    6: 'Urgot',
-    7: 'LeBlanc',
-    8: 'Vladimir',
-    9: 'Fiddlesticks',
-    10: 'Kayle',
-    11: 'Master Yi',
-    12: 'Alistar',
-    13: 'Ryze',
-    14: 'Sion',
-    15: 'Sivir',
-    16: 'Soraka',
-    17: 'Teemo',
-    18: 'Tristana',
-    19: 'Warwick',
-    20: 'Nunu & Willump',
-    21: 'Miss Fortune',
-    22: 'Ashe',
-    23: 'Tryndamere',
-    24: 'Jax',
-    25: 'Morgana',
-    26: 'Zilean',
-    27: 'Singed',
-    28: 'Evelynn',
-    29: 'Twitch',
-    30: 'Karthus',
-    31: "Cho'Gath",
-    32: 'Amumu',
-    33: 'Rammus',
-    34: 'Anivia',
-    35: 'Shaco',
-    36: 'Dr.Mundo',
-    37: 'Sona',
-    38: 'Kassadin',
-    39: 'Irelia',
-    40: 'Janna',
-    41: 'Gangplank',
-    42: 'Corki',
-    43: 'Karma',
-    44: 'Taric',
-    45: 'Veigar',
-    48: 'Trundle',
-    50: 'Swain',
-    51: 'Caitlyn',
-    53: 'Blitzcrank',
-    54: 'Malphite',
-    55: 'Katarina',
-    56: 'Nocturne',
-    57: 'Maokai',
-    58: 'Renekton',
-    59: 'Jarvan IV',
-    60: 'Elise',
-    61: 'Orianna',
-    62: 'Wukong',
-    63: 'Brand',
-    64: 'Lee Sin',
-    67: 'Vayne',
-    68: 'Rumble',
-    69: 'Cassiopeia',
-    72: 'Skarner',
-    74: 'Heimerdinger',
-    75: 'Nasus',
-    76: 'Nidalee',
-    77: 'Udyr',
-    78: 'Poppy',
-    79: 'Gragas',
-    80: 'Pantheon',
-    81: 'Ezreal',
-    82: 'Mordekaiser',
-    83: 'Yorick',
-    84: 'Akali',
-    85: 'Kennen',
-    86: 'Garen',
-    89: 'Leona',
-    90: 'Malzahar',
-    91: 'Talon',
-    92: 'Riven',
-    96: "Kog'Maw",
-    98: 'Shen',
-    99: 'Lux',
-    101: 'Xerath',
-    102: 'Shyvana',
-    103: 'Ahri',
-    104: 'Graves',
-    105: 'Fizz',
-    106: 'Volibear',
-    107: 'Rengar',
-    110: 'Varus',
-    111: 'Nautilus',
-    112: 'Viktor',
-    113: 'Sejuani',
-    114: 'Fiora',
-    115: 'Ziggs',
-    117: 'Lulu',
-    119: 'Draven',
-    120: 'Hecarim',
-    121: "Kha'Zix",
-    122: 'Darius',
-    126: 'Jayce',
-    127: 'Lissandra',
-    131: 'Diana',
-    133: 'Quinn',
-    134: 'Syndra',
-    136: 'Aurelion Sol',
-    141: 'Kayn',
-    142: 'Zoe',
-    143: 'Zyra',
-    145: "Kai'sa",
-    147: "Seraphine",
-    150: 'Gnar',
-    154: 'Zac',
-    157: 'Yasuo',
-    161: "Vel'Koz",
-    163: 'Taliyah',
-    166: "Akshan",
-    164: 'Camille',
-    201: 'Braum',
-    202: 'Jhin',
-    203: 'Kindred',
-    222: 'Jinx',
-    223: 'TahmKench',
-    234: 'Viego',
-    235: 'Senna',
-    236: 'Lucian',
-    238: 'Zed',
-    240: 'Kled',
-    245: 'Ekko',
-    246: 'Qiyana',
-    254: 'Vi',
-    266: 'Aatrox',
-    267: 'Nami',
-    268: 'Azir',
-    350: 'Yuumi',
-    360: 'Samira',
-    412: 'Thresh',
-    420: 'Illaoi',
-    421: "Rek'Sai",
-    427: 'Ivern',
-    429: 'Kalista',
-    432: 'Bard',
-    497: 'Rakan',
-    498: 'Xayah',
-    516: 'Ornn',
-    517: 'Sylas',
-    526: 'Rell',
-    518: 'Neeko',
-    523: 'Aphelios',
-    555: 'Pyke',
-    875: "Sett",
-    711: "Vex",
-    777: "Yone",
-    887: "Gwen",
-    876: "Lillia",
-    888: "Renata Glasc",
-    200: "Bel'Veth",
-    895: "Nilah",
-    897: "K'Sante",
-    902: "Milio",
-    950: "Naafiri",
-    233: "Briar",
-    910: "Hwei",
-    901: "Smolder",
-    893: "Aurora",
-    221: "Zeri"
-
-}
-
-emoji_mapping = {
-    1: '<:annie:1283824753899081791>',
-    2: '<:olaf:1283824848388227134>',
-    3: '<:galio:1283824854965026937>',
-    4: '<:twistedfate:1283824861093036103>',
-    5: '<:xinxhao:1283824876041539614>',
-    6: '<:urgot:1283824890688045087>',
-    7: '<:leblanc:1283824897981812806>',
-    8: '<:vladimir:1283824904688504952>',
-    9: '<:fiddlesticks:1283824911504375859>',
-    10: '<:kayle:1283824917682327612>',
-    11: '<:masteryi:1283824923529445488>',
-    12: '<:alistar:1283824929330167919>',
-    13: '<:ryze:1283824935290273856>',
-    14: '<:sion:1283824941443190794>',
-    15: '<:sivir:1283824948619776143>',
-    16: '<:soraka:1283824955649163284>',
-    17: '<:teemo:1283824961097830533>',
-    18: '<:tristana:1283824968450441359>',
-    19: '<:warwick:1283824976209772625>',
-    20: '<:nunu:1283824983163928707>',
-    21: '<:missfortune:1283824989769957469>',
-    22: '<:ashe:1283824995260170270>',
-    23: '<:tryndamere:1283825001094713406>',
-    24: '<:jax:1283825007247495269>',
-    25: '<:morgana:1283825012540837993>',
-    26: '<:zilean:1283825018198818816>',
-    27: '<:singed:1283825024503119987>',
-    28: '<:evelynn:1283825030593253457>',
-    29: '<:twitch:1283825036536578170>',
-    30: '<:karthus:1283825042563530792>',
-    31: "<:chogath:1283825048561385492>",
-    32: '<:amumu:1283825058061750294>',
-    33: '<:rammus:1283825067536683070>',
-    34: '<:anivia:1283825073475813376>',
-    35: '<:shaco:1283825079477862483>',
-    36: '<:mundo:1283825185950142465>',
-    37: '<:sona:1283825193583771759>',
-    38: '<:kassadin:1283825200776871978>',
-    39: '<:irelia:1283825207525769356>',
-    40: '<:janna:1283825214802755666>',
-    41: '<:gangplank:1283825221047947328>',
-    42: '<:corki:1283825227880726568>',
-    43: '<:karma:1283825234545348670>',
-    44: '<:taric:1283825240098607125>',
-    45: '<:veigar:1283825247736303680>',
-    48: '<:trundle:1283825256041025556>',
-    50: '<:swain:1283825289419558985>',
-    51: '<:caitlyn:1283825307954188319>',
-    53: '<:blitzcrank:1283825314408956014>',
-    54: '<:malphite:1283825321367306333>',
-    55: '<:katarina:1283832220334817291>',
-    56: '<:nocturne:1283825332905840642>',
-    57: '<:maokai:1283825339365326899>',
-    58: '<:renekton:1283825348609577073>',
-    59: '<:jarvaniv:1283825357031739484>',
-    60: '<:elise:1283825364610711612>',
-    61: '<:orianna:1283825371061420124>',
-    62: '<:wukong:1283825377017462855>',
-    63: '<:brand:1283825382818320464>',
-    64: '<:leesin:1283825390011289620>',
-    67: '<:vayne:1283825399062593698>',
-    68: '<:rumble:1283825407946133525>',
-    69: '<:cassiopeia:1283825416661893191>',
-    72: '<:skarner:1283825422940766310>',
-    74: '<:heimerdinger:1283825428947144794>',
-    75: '<:nasus:1283825435804962847>',
-    76: '<:nidalee:1283825443283144837>',
-    77: '<:udyr:1283825449033666560>',
-    78: '<:poppy:1283825456570695742>',
-    79: '<:gragas:1283825463248162998>',
-    80: '<:pantheon:1283825472320442431>',
-    81: '<:ezreal:1283825508483731556>',
-    82: '<:mordekaiser:1283825514083254385>',
-    83: '<:yorick:1283825522622595124>',
-    84: '<:akali:1283825529014980630>',
-    85: '<:kennen:1283825535046258811>',
-    86: '<:garen:1283825541324996618>',
-    89: '<:leona:1283825548971479143>',
-    90: '<:malzahar:1283825555699011695>',
-    91: '<:talon:1283825562053247047>',
-    92: '<:riven:1283825574715854928>',
-    96: "<:kogmaw:1283825582110675005>",
-    98: '<:shen:1283825588431491295>',
-    99: '<:lux:1283825595427459122>',
-    101: '<:xerath:1283825604537483286>',
-    102: '<:shyvanna:1283825610812297241>',
-    103: '<:ahri:1283825617669718087>',
-    104: '<:graves:1283825624036802571>',
-    105: '<:fizz:1283825632957960266>',
-    106: '<:volibear:1283825639354536017>',
-    107: '<:rengar:1283825648300855306>',
-    110: '<:varus:1283825657071013902>',
-    111: '<:nautilus:1283825664427819130>',
-    112: '<:viktor:1283825671075921981>',
-    113: '<:sejuani:1283825676620796056>',
-    114: '<:fiora:1283825682287165451>',
-    115: '<:ziggs:1283825688390140025>',
-    117: '<:lulu:1283825693985083415>',
-    119: '<:draven:1283825701560258600>',
-    120: '<:hecarim:1283825707755245650>',
-    121: "<:khazix:1283825714541629523>",
-    122: '<:darius:1283825720367255605>',
-    126: '<:jayce:1283825725513797746>',
-    127: '<:lissandra:1283825731574694013>',
-    131: '<:diana:1283825737710964766>',
-    133: '<:quinn:1283825743570272447>',
-    134: '<:syndra:1283825752361537587>',
-    136: '<:aurelionsol:1283825789934108785>',
-    141: '<:kayn:1283825797546901545>',
-    142: '<:zoe:1283825803775443004>',
-    143: '<:zyra:1283825810288934933>',
-    145: "<:kaisa:1283825816085598303>",
-    147: "<:seraphie:1283825821819076700>",
-    150: '<:gnar:1283825827510878240>',
-    154: '<:zac:1283825832732921896>',
-    157: '<:yasuo:1283825838437044275>',
-    161: "<:velkoz:1283825846452490320>",
-    163: '<:taliyah:1283825852924170262>',
-    166: "<:akshan:1283825864148127815>",
-    164: '<:camille:1283825858934603786>',
-    201: '<:braum:1283825876936556586>',
-    202: '<:jhin:1283825882716442716>',
-    203: '<:kindred:1283825887657201775>',
-    222: '<:jinx:1283825899900502118>',
-    223: '<:tahmkench:1283825905659285524>',
-    234: '<:viego:1283825917281435731>',
-    235: '<:senna:1283825923728343143>',
-    236: '<:lucian:1283825930749476925>',
-    238: '<:zed:1283825936604729395>',
-    240: '<:kled:1283825942598520883>',
-    245: '<:ekko:1283825948755759195>',
-    246: '<:qiyana:1283825955810312253>',
-    254: '<:vi:1283825962773123104>',
-    266: '<:aatrox:1283825968925905028>',
-    267: '<:nami:1283825974303002695>',
-    268: '<:azir:1283825979902525512>',
-    350: '<:yummi:1283825986370273334>',
-    360: '<:samira:1283825994070753332>',
-    412: '<:thresh:1283825999577874576>',
-    420: '<:illaoi:1283826005915598911>',
-    421: "<:reksai:1283826030611529882>",
-    427: '<:ivern:1283826037448249397>',
-    429: '<:kalista:1283826042871480320>',
-    432: '<:bard:1283826048450039808>',
-    497: '<:rakan:1283826054451953684>',
-    498: '<:xayah:1283826062270402581>',
-    516: '<:ornn:1283826068028915763>',
-    517: '<:sylas:1283826077764157565>',
-    526: '<:rell:1283826096588197969>',
-    518: '<:neeko:1283826083539718195>',
-    523: '<:aphelios:1283826089419870361>',
-    555: '<:pyke:1283826102636249192>',
-    875: "<:sett:1283826120512508017>",
-    711: "<:vex:1283826108902543380>",
-    777: "<:yone:1283826114695008356>",
-    887: "<:gwen:1283826132449493002>",
-    876: "<:lillia:1283826126367621162>",
-    888: "<:renataglasc:1283826138149556246>",
-    200: "<:belveth:1283825869684605020>",
-    895: "<:nilah:1283826156461756446>",
-    897: "<:ksante:1283826164091195454>",
-    902: "<:milio:1283826175147245598>",
-    950: "<:naafiri:1283826189525319700>",
-    233: "<:briar:1283825911531311249>",
-    910: "<:hwei:1283826183150112813>",
-    901: "<:smolder:1283826169271160832>",
-    893: "<:aurora:1283826149201547295>",
-    221: "<:zeri:1283825893885743114>"
-
-}
-
-def get_champion_name(champion_id):
-    champion_name = champion_mapping.get(champion_id, "Unknown Champion")
-    emoji_name = emoji_mapping.get(champion_id, "<:blank:1283824838787596298>")
-
-    return f"{emoji_name} {champion_name}"
\ No newline at end of file
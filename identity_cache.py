@@ -0,0 +1,53 @@
+import json
+import os
+import time
+
+from match_cache import CACHE_DIR
+from metrics import metrics
+
+IDENTITY_CACHE_PATH = os.path.join(CACHE_DIR, 'accounts.json')
+ACCOUNT_TTL = 7 * 24 * 3600  # Seconds a resolved Riot ID -> PUUID lookup is trusted
+
+
+# Resolved Riot accounts keyed by "gamename#tagline", persisted to disk so a restart
+# does not have to look them up again
+class IdentityCache:
+    def __init__(self, path=IDENTITY_CACHE_PATH, ttl=ACCOUNT_TTL):
+        self.path = path
+        self.ttl = ttl
+        self._accounts = None
+
+    @staticmethod
+    def key(game_name, tag_line):
+        return f'{game_name}#{tag_line}'.lower()
+
+    def _load(self):
+        if self._accounts is None:
+            try:
+                with open(self.path) as f:
+                    self._accounts = json.load(f)
+            except (OSError, ValueError):
+                self._accounts = {}
+        return self._accounts
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f'{self.path}.tmp.{os.getpid()}'  # Every bot worker saves on startup, never share a temp file
+        with open(tmp_path, 'w') as f:
+            json.dump(self._accounts, f)
+        os.replace(tmp_path, self.path)
+
+    # Return the cached account info if it has not expired
+    def get(self, game_name, tag_line):
+        entry = self._load().get(self.key(game_name, tag_line))
+        hit = entry is not None and time.time() - entry['resolved_at'] < self.ttl
+        metrics.cache_lookup('account', hit)
+        return entry['account'] if hit else None
+
+    def put(self, game_name, tag_line, account_info):
+        self._load()[self.key(game_name, tag_line)] = {'account': account_info, 'resolved_at': time.time()}
+        self._save()
+
+
+# Shared instance used by account()
+identity_cache = IdentityCache()
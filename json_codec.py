@@ -0,0 +1,114 @@
+import json
+
+from worker_pool import cpu_pool, PoolFull
+
+try:
+    import msgspec
+except ImportError:  # Optional, fastest and decodes straight into the typed schemas below
+    msgspec = None
+try:
+    import orjson
+except ImportError:  # Optional, used when msgspec is not installed
+    orjson = None
+
+OFFLOAD_BYTES = 128 * 1024  # Bodies at least this large are decoded on a worker thread, off the event loop
+
+if msgspec is not None:
+    DECODER = 'msgspec'
+    loads = msgspec.json.decode
+    dumps = msgspec.json.encode
+elif orjson is not None:
+    DECODER = 'orjson'
+    loads = orjson.loads
+    dumps = orjson.dumps
+else:
+    DECODER = 'json'
+    loads = json.loads
+
+    def dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+
+# Typed schemas holding only the fields the bot reads, keyed by the riot_client method name.
+# With msgspec, payloads for these methods are decoded into them (skipping every other field)
+# and handed on as plain dicts of just those fields; the other decoders return the full document.
+SCHEMAS = {}
+
+if msgspec is not None:
+    class _Struct(msgspec.Struct, rename='camel'):
+        pass
+
+    class Ban(_Struct):
+        champion_id: int
+
+    class Team(_Struct):
+        team_id: int
+        bans: list[Ban] = []
+
+    class MatchParticipant(_Struct):
+        puuid: str
+        participant_id: int
+        champion_id: int
+        team_id: int
+        win: bool
+        kills: int
+        deaths: int
+        assists: int
+        total_minions_killed: int = 0
+        neutral_minions_killed: int = 0
+        summoner1_id: int = 0
+        summoner2_id: int = 0
+        team_position: str = ''
+
+    class MatchInfo(_Struct):
+        game_creation: int
+        game_duration: int
+        queue_id: int
+        participants: list[MatchParticipant]
+        teams: list[Team] = []
+
+    class MatchMetadata(_Struct):
+        match_id: str
+
+    class MatchPayload(_Struct):
+        metadata: MatchMetadata
+        info: MatchInfo
+
+    class LiveParticipant(_Struct):
+        champion_id: int
+        team_id: int
+        puuid: str | None = None  # null for bots, parse_live_game turns it into ''
+        spell1_id: int = 0
+        spell2_id: int = 0
+
+    class LiveGamePayload(_Struct):
+        game_id: int
+        game_queue_config_id: int
+        participants: list[LiveParticipant]
+        platform_id: str = 'NA1'
+        game_start_time: int = 0
+        game_length: int = 0
+        banned_champions: list[Ban] = []
+
+    SCHEMAS = {
+        'match-v5.match': msgspec.json.Decoder(MatchPayload),
+        'spectator-v5.active-games': msgspec.json.Decoder(LiveGamePayload),
+    }
+
+
+# Decode a response body, using the method's typed schema if there is one
+def decode_sync(body, method=None):
+    decoder = SCHEMAS.get(method)
+    if decoder is not None:
+        return msgspec.to_builtins(decoder.decode(body))
+    return loads(body)
+
+
+# Decode a response body, moving large ones to the worker pool so the loop keeps serving the gateway
+async def decode(body, method=None):
+    if len(body) >= OFFLOAD_BYTES:
+        try:
+            return await cpu_pool.run(decode_sync, body, method)
+        except PoolFull:
+            pass  # Decoding inline beats failing the request
+    return decode_sync(body, method)
@@ -0,0 +1,61 @@
+import time
+
+from metrics import metrics
+
+IN_GAME_MAX_AGE = 120  # Seconds a spectator snapshot is served before /livegame asks Riot again, unless the poller holds it longer
+NOT_IN_GAME_MAX_AGE = 30  # Seconds a "not in a game" answer is trusted
+POLL_SLACK = 10  # Seconds a held snapshot outlives the poller's next scheduled look, covering the poll itself
+HELD_GAME_OVERRUN = 5 * 60  # Seconds past the expected game length a held snapshot may still be served
+MAX_SNAPSHOTS = 1000  # Expired snapshots are swept once this many are held
+
+
+class Snapshot:
+    __slots__ = ('payload', 'taken_at', 'max_age')
+
+    def __init__(self, payload, taken_at):
+        self.payload = payload  # spectator-v5 active game, or None if the player was not in one
+        self.taken_at = taken_at  # time.monotonic()
+        self.max_age = IN_GAME_MAX_AGE if payload is not None else NOT_IN_GAME_MAX_AGE
+
+
+# Latest spectator-v5 answer per PUUID, published by the spectator poller (and by /livegame's own
+# fetches) so /livegame can answer without another Riot call. Picks, spells and bans never change
+# during a game; only gameLength moves, and that is extrapolated from the snapshot's age.
+# Snapshots live in the process that polled the player: with several bot workers, /livegame on
+# another worker's shard still asks Riot.
+class LiveGameCache:
+    def __init__(self):
+        self._snapshots = {}
+
+    # Record a player's current game, or None when they are not in one
+    def publish(self, puuid, payload):
+        now = time.monotonic()
+        if len(self._snapshots) >= MAX_SNAPSHOTS:
+            self._snapshots = {k: s for k, s in self._snapshots.items() if now - s.taken_at < s.max_age}
+        self._snapshots[puuid] = Snapshot(payload, now)
+
+    # Keep a player's in-game snapshot fresh until the poller looks again in `delay` seconds, but
+    # not long past `expected_length` seconds of game time. Only call this right after the poller
+    # published the snapshot: a failed poll has seen nothing and must not extend it.
+    def hold(self, puuid, delay, expected_length):
+        snapshot = self._snapshots.get(puuid)
+        if snapshot is not None and snapshot.payload is not None:
+            held = time.monotonic() - snapshot.taken_at + delay + POLL_SLACK
+            overrun = expected_length + HELD_GAME_OVERRUN - snapshot.payload.get('gameLength', 0)
+            snapshot.max_age = max(IN_GAME_MAX_AGE, min(held, overrun))
+
+    # Returns (True, payload or None) for a fresh snapshot, (False, None) when Riot must be asked
+    def get(self, puuid):
+        snapshot = self._snapshots.get(puuid)
+        age = time.monotonic() - snapshot.taken_at if snapshot else None
+        fresh = snapshot is not None and age < snapshot.max_age
+        metrics.cache_lookup('live_game', fresh)
+        if not fresh:
+            return False, None
+        if snapshot.payload is None:
+            return True, None
+        return True, {**snapshot.payload, 'gameLength': snapshot.payload.get('gameLength', 0) + int(age)}
+
+
+# Shared instance written by the spectator poller and read by /livegame
+live_games = LiveGameCache()
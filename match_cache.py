@@ -0,0 +1,88 @@
+import os
+import sqlite3
+import time
+import zlib
+
+from metrics import metrics
+from json_codec import loads, dumps
+
+CACHE_DIR = 'cache'
+MATCH_CACHE_PATH = os.path.join(CACHE_DIR, 'matches.sqlite3')
+MAX_CACHE_BYTES = 200 * 1024 * 1024  # Compressed size cap before least recently used matches are evicted
+
+
+# Persistent store for match-v5 payloads. A finished match never changes, so once a
+# payload is stored it is served from disk forever (or until evicted by the size cap).
+class MatchCache:
+    def __init__(self, path=MATCH_CACHE_PATH, max_bytes=MAX_CACHE_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._db = None
+
+    def _connect(self):
+        if self._db is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            self._db = sqlite3.connect(self.path)
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS matches ('
+                'match_id TEXT PRIMARY KEY, payload BLOB NOT NULL, size INTEGER NOT NULL, last_access REAL NOT NULL)'
+            )
+            self._db.execute('CREATE INDEX IF NOT EXISTS matches_last_access ON matches (last_access)')
+            # Post-game timeline summaries, kept and evicted together with their match
+            self._db.execute('CREATE TABLE IF NOT EXISTS timeline_summaries (match_id TEXT PRIMARY KEY, summary BLOB NOT NULL)')
+        return self._db
+
+    # Return the cached payload for a match or None
+    def get(self, match_id):
+        db = self._connect()
+        row = db.execute('SELECT payload FROM matches WHERE match_id = ?', (match_id,)).fetchone()
+        metrics.cache_lookup('match', row is not None)
+        if row is None:
+            return None
+        db.execute('UPDATE matches SET last_access = ? WHERE match_id = ?', (time.time(), match_id))
+        db.commit()
+        return loads(zlib.decompress(row[0]))
+
+    # Store a payload compressed and evict the oldest entries if over the size cap
+    def put(self, match_id, payload):
+        blob = zlib.compress(dumps(payload))
+        db = self._connect()
+        db.execute(
+            'INSERT OR REPLACE INTO matches (match_id, payload, size, last_access) VALUES (?, ?, ?, ?)',
+            (match_id, blob, len(blob), time.time()),
+        )
+        self._evict(db)
+        db.commit()
+
+    def get_timeline_summary(self, match_id):
+        row = self._connect().execute('SELECT summary FROM timeline_summaries WHERE match_id = ?', (match_id,)).fetchone()
+        metrics.cache_lookup('timeline', row is not None)
+        return loads(zlib.decompress(row[0])) if row else None
+
+    def put_timeline_summary(self, match_id, summary):
+        db = self._connect()
+        db.execute(
+            'INSERT OR REPLACE INTO timeline_summaries (match_id, summary) VALUES (?, ?)',
+            (match_id, zlib.compress(dumps(summary))),
+        )
+        db.commit()
+
+    def _evict(self, db):
+        total = db.execute('SELECT COALESCE(SUM(size), 0) FROM matches').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for match_id, size in db.execute('SELECT match_id, size FROM matches ORDER BY last_access').fetchall():
+            db.execute('DELETE FROM matches WHERE match_id = ?', (match_id,))
+            db.execute('DELETE FROM timeline_summaries WHERE match_id = ?', (match_id,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+# Shared instance used by get_match_details
+match_cache = MatchCache()
@@ -0,0 +1,54 @@
+from riot_client import riot
+from rate_limiter import PRIORITY_COMMAND
+from match_cache import match_cache
+
+MATCH_PAGE_SIZE = 20  # Match ids requested per match-v5 ids call (Riot allows up to 100)
+
+
+# Get match details for a given match ID, served from the local match cache when possible
+async def get_match_details(match_id, priority=PRIORITY_COMMAND):
+    cached = match_cache.get(match_id)
+    if cached is not None:
+        return cached
+    status, data = await riot.get('americas', f'/lol/match/v5/matches/{match_id}', method='match-v5.match', priority=priority)
+    if status == 200:
+        match_cache.put(match_id, data)
+        return data
+    return None
+
+
+# Lazily paged view over one player's match-v5 history. Match ids come back newest first;
+# every page fetched is kept so later pages never refetch earlier ones, and match details
+# are only downloaded for the slice that is actually requested.
+class MatchHistory:
+    def __init__(self, puuid, queue=None, start_time=None, end_time=None, page_size=MATCH_PAGE_SIZE, priority=PRIORITY_COMMAND):
+        self.puuid = puuid
+        self.queue = queue
+        self.start_time = start_time  # Epoch seconds, only matches after this
+        self.end_time = end_time  # Epoch seconds, only matches before this
+        self.page_size = page_size
+        self.priority = priority
+        self.ids = []
+        self.exhausted = False
+
+    async def _fetch_page(self, count):
+        params = {'start': len(self.ids), 'count': count}
+        if self.queue is not None:
+            params['queue'] = self.queue
+        if self.start_time is not None:
+            params['startTime'] = self.start_time
+        if self.end_time is not None:
+            params['endTime'] = self.end_time
+        status, data = await riot.get('americas', f'/lol/match/v5/matches/by-puuid/{self.puuid}/ids', params=params, method='match-v5.ids', priority=self.priority)
+        if status != 200 or not data:
+            self.exhausted = True
+            return
+        self.ids.extend(data)
+        if len(data) < count:
+            self.exhausted = True
+
+    # Match ids [start, start + count), fetching more pages only if needed
+    async def get_ids(self, start, count):
+        while len(self.ids) < start + count and not self.exhausted:
+            await self._fetch_page(max(self.page_size, start + count - len(self.ids)))
+        return self.ids[start:start + count]
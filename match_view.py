@@ -0,0 +1,103 @@
+from dataclasses import dataclass, field
+
+
+# The fields of one participant the bot actually uses, read once from the raw payload
+@dataclass(slots=True)
+class ParticipantView:
+    puuid: str
+    champion_id: int
+    team_id: int
+    win: bool = False
+    kills: int = 0
+    deaths: int = 0
+    assists: int = 0
+    cs: int = 0  # Lane minions + neutral monsters
+    cs_per_minute: float = 0.0
+    spell1_id: int = 0
+    spell2_id: int = 0
+
+    @property
+    def kda(self):
+        return f"{self.kills}/{self.deaths}/{self.assists}"
+
+
+# A match (or live game) parsed once and indexed by player and by team
+@dataclass(slots=True)
+class MatchView:
+    match_id: str
+    queue_id: int
+    game_creation: int  # Epoch milliseconds
+    duration: int  # Seconds
+    participants: list
+    by_puuid: dict = field(default_factory=dict)
+    by_team: dict = field(default_factory=dict)
+    banned_champion_ids: list = field(default_factory=list)
+
+    def __post_init__(self):
+        for participant in self.participants:
+            self.by_puuid[participant.puuid] = participant
+            self.by_team.setdefault(participant.team_id, []).append(participant)
+
+    # Participants whose PUUID is in `puuids` (any set or dict), one pass over the participants
+    def find_players(self, puuids):
+        return [participant for participant in self.participants if participant.puuid in puuids]
+
+    # Participants on the same team as `participant`, then everyone else
+    def allies_and_enemies(self, participant):
+        allies = self.by_team.get(participant.team_id, [])
+        enemies = [p for team_id, team in self.by_team.items() if team_id != participant.team_id for p in team]
+        return allies, enemies
+
+
+# Parse a match-v5 payload
+def parse_match(payload):
+    info = payload['info']
+    duration = info['gameDuration']
+    minutes = duration // 60 or 1
+    participants = []
+    for raw in info['participants']:
+        cs = raw.get('totalMinionsKilled', 0) + raw.get('neutralMinionsKilled', 0)
+        participants.append(ParticipantView(
+            puuid=raw['puuid'],
+            champion_id=raw['championId'],
+            team_id=raw['teamId'],
+            win=raw['win'],
+            kills=raw['kills'],
+            deaths=raw['deaths'],
+            assists=raw['assists'],
+            cs=cs,
+            cs_per_minute=cs / minutes,
+            spell1_id=raw.get('summoner1Id', 0),
+            spell2_id=raw.get('summoner2Id', 0),
+        ))
+    bans = [ban['championId'] for team in info.get('teams', []) for ban in team.get('bans', [])]
+    return MatchView(
+        match_id=payload['metadata']['matchId'],
+        queue_id=info['queueId'],
+        game_creation=info['gameCreation'],
+        duration=duration,
+        participants=participants,
+        banned_champion_ids=bans,
+    )
+
+
+# Parse a spectator-v5 active game payload into the same view (no stats yet, so only picks and spells)
+def parse_live_game(payload):
+    participants = [
+        ParticipantView(
+            puuid=raw.get('puuid') or '',  # Bots have a null PUUID
+            champion_id=raw['championId'],
+            team_id=raw['teamId'],
+            spell1_id=raw.get('spell1Id', 0),
+            spell2_id=raw.get('spell2Id', 0),
+        )
+        for raw in payload['participants']
+    ]
+    return MatchView(
+        match_id=f"{payload.get('platformId', 'NA1')}_{payload['gameId']}",
+        queue_id=payload['gameQueueConfigId'],
+        game_creation=payload.get('gameStartTime', 0),
+        duration=payload.get('gameLength', 0),
+        participants=participants,
+        banned_champion_ids=[ban['championId'] for ban in payload.get('bannedChampions', [])],
+    )
@@ -0,0 +1,188 @@
+import asyncio
+import time
+from collections import defaultdict
+
+from aiohttp import web
+
+METRICS_HOST = '127.0.0.1'
+METRICS_PORT = 9108  # Local Prometheus scrape endpoint, served at /metrics
+METRICS_LOG_INTERVAL = 300  # Seconds between summary dumps to the console
+LOOP_LAG_INTERVAL = 0.5  # Seconds between event loop lag probes
+LOOP_LAG_WARNING = 0.1  # Warn when the loop was blocked for longer than this
+
+# Latency histogram bucket upper bounds, in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, float('inf'))
+
+
+# Cumulative-bucket latency histogram in the Prometheus style
+class Histogram:
+    __slots__ = ('counts', 'total', 'count')
+
+    def __init__(self):
+        self.counts = [0] * len(LATENCY_BUCKETS)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, seconds):
+        self.total += seconds
+        self.count += 1
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.counts[i] += 1
+                break
+
+    # Upper bound of the bucket holding the given quantile (0-1)
+    def quantile(self, q):
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for bound, bucket_count in zip(LATENCY_BUCKETS, self.counts):
+            seen += bucket_count
+            if seen >= target:
+                return bound
+        return LATENCY_BUCKETS[-1]
+
+
+# Process-wide metric registry: histograms and counters keyed by a tuple of label values
+class Metrics:
+    def __init__(self):
+        self.started = time.time()
+        self.riot_latency = defaultdict(Histogram)  # (method, status)
+        self.command_latency = defaultdict(Histogram)  # (command, outcome)
+        self.cache_lookups = defaultdict(int)  # (cache, "hit" | "miss")
+        self.errors = defaultdict(int)  # (where,)
+        self.coalesced_requests = defaultdict(int)  # (method,) calls served by an identical in-flight request
+        self.worker_jobs = defaultdict(Histogram)  # (pool,) queue + run time of worker pool jobs
+        self.loop_lag = Histogram()  # How late the event loop woke up for each probe
+        self.max_loop_lag = 0.0
+
+    def observe_riot_call(self, method, status, seconds):
+        self.riot_latency[(method, str(status))].observe(seconds)
+
+    def observe_command(self, command, outcome, seconds):
+        self.command_latency[(command, outcome)].observe(seconds)
+
+    def cache_lookup(self, cache, hit):
+        self.cache_lookups[(cache, 'hit' if hit else 'miss')] += 1
+
+    def error(self, where):
+        self.errors[(where,)] += 1
+
+    def coalesced(self, method):
+        self.coalesced_requests[(method,)] += 1
+
+    def observe_worker_job(self, pool, seconds):
+        self.worker_jobs[(pool,)].observe(seconds)
+
+    def observe_loop_lag(self, seconds):
+        self.loop_lag.observe(seconds)
+        self.max_loop_lag = max(self.max_loop_lag, seconds)
+
+    @property
+    def rate_limited(self):
+        return sum(h.count for (_, status), h in self.riot_latency.items() if status == '429')
+
+    # Prometheus text exposition format
+    def render_prometheus(self):
+        lines = []
+
+        def histogram(name, help_text, histograms, label_names):
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} histogram')
+            for label_values, h in sorted(histograms.items()):
+                labels = ','.join(f'{k}="{v}"' for k, v in zip(label_names, label_values))
+                cumulative = 0
+                for bound, bucket_count in zip(LATENCY_BUCKETS, h.counts):
+                    cumulative += bucket_count
+                    le = '+Inf' if bound == float('inf') else bound
+                    bucket_labels = f'{labels},le="{le}"' if labels else f'le="{le}"'
+                    lines.append(f'{name}_bucket{{{bucket_labels}}} {cumulative}')
+                lines.append(f'{name}_sum{{{labels}}} {h.total}')
+                lines.append(f'{name}_count{{{labels}}} {h.count}')
+
+        def counter(name, help_text, counters, label_names):
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} counter')
+            for label_values, value in sorted(counters.items()):
+                labels = ','.join(f'{k}="{v}"' for k, v in zip(label_names, label_values))
+                lines.append(f'{name}{{{labels}}} {value}')
+
+        histogram('riot_request_seconds', 'Riot API call latency by endpoint and status', self.riot_latency, ('method', 'status'))
+        histogram('command_seconds', 'Slash command end-to-end latency', self.command_latency, ('command', 'outcome'))
+        counter('cache_lookups_total', 'Local cache lookups by result', self.cache_lookups, ('cache', 'result'))
+        counter('errors_total', 'Errors caught and reported', self.errors, ('where',))
+        counter('riot_coalesced_requests_total', 'Riot calls answered by an identical in-flight request', self.coalesced_requests, ('method',))
+        histogram('worker_job_seconds', 'Worker pool job latency including queueing', self.worker_jobs, ('pool',))
+        histogram('event_loop_lag_seconds', 'Delay between when the event loop should have woken up and when it did', {(): self.loop_lag}, ())
+        lines.append('# HELP bot_uptime_seconds Seconds since the bot started')
+        lines.append('# TYPE bot_uptime_seconds gauge')
+        lines.append(f'bot_uptime_seconds {time.time() - self.started:.0f}')
+        return '\n'.join(lines) + '\n'
+
+    # Short human readable lines for the console dump and /botstats
+    def summary_lines(self):
+        lines = []
+        by_method = defaultdict(Histogram)
+        for (method, _), h in self.riot_latency.items():
+            merged = by_method[method]
+            merged.total += h.total
+            merged.count += h.count
+            merged.counts = [a + b for a, b in zip(merged.counts, h.counts)]
+        for method, h in sorted(by_method.items()):
+            lines.append(f"{method}: {h.count} calls, avg {h.total / h.count * 1000:.0f}ms, p95 <= {h.quantile(0.95) * 1000:.0f}ms")
+        for (command, outcome), h in sorted(self.command_latency.items()):
+            lines.append(f"/{command} ({outcome}): {h.count} runs, avg {h.total / h.count * 1000:.0f}ms, p95 <= {h.quantile(0.95) * 1000:.0f}ms")
+        caches = sorted({cache for cache, _ in self.cache_lookups})
+        for cache in caches:
+            hits = self.cache_lookups[(cache, 'hit')]
+            misses = self.cache_lookups[(cache, 'miss')]
+            lines.append(f"{cache} cache: {hits} hits, {misses} misses ({hits / (hits + misses) * 100:.0f}% hit rate)")
+        lines.append(f"Riot 429s: {self.rate_limited}")
+        lines.append(f"Coalesced Riot calls: {sum(self.coalesced_requests.values())}")
+        lines.append(f"Event loop lag: p95 <= {self.loop_lag.quantile(0.95) * 1000:.0f}ms, max {self.max_loop_lag * 1000:.0f}ms")
+        lines.append(f"Errors: {sum(self.errors.values())}")
+        return lines
+
+
+# Shared registry every module records into
+metrics = Metrics()
+
+
+# Serve /metrics on the local interface for a Prometheus scraper
+async def start_metrics_server(host=METRICS_HOST, port=METRICS_PORT):
+    async def handle(request):
+        return web.Response(text=metrics.render_prometheus(), content_type='text/plain')
+
+    app = web.Application()
+    app.router.add_get('/metrics', handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    try:
+        await web.TCPSite(runner, host, port).start()
+    except OSError as e:
+        print(f"\033[93mMetrics endpoint unavailable: {e}\033[0m")
+        await runner.cleanup()
+        return None
+    print(f"\033[32mMetrics available at http://{host}:{port}/metrics\033[0m")
+    return runner
+
+
+# Sleep in short steps and measure how late the loop wakes up each time. A late wake-up means
+# something blocked the loop, which also delays Discord gateway heartbeats.
+async def monitor_loop_lag(interval=LOOP_LAG_INTERVAL, warning=LOOP_LAG_WARNING):
+    loop = asyncio.get_running_loop()
+    while True:
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        lag = max(0.0, loop.time() - expected)
+        metrics.observe_loop_lag(lag)
+        if lag > warning:
+            print(f"\033[93mEvent loop blocked for {lag * 1000:.0f}ms\033[0m")
+
+
+# Print a metrics summary to the console every METRICS_LOG_INTERVAL seconds
+async def log_metrics():
+    while True:
+        await asyncio.sleep(METRICS_LOG_INTERVAL)
+        print("\033[36m" + "\n".join(metrics.summary_lines()) + "\033[0m")
@@ -0,0 +1,51 @@
+from static_data import get_queue_type
+from events import GameStarted, MatchResult, ResultUnavailable, RankChanged, TimelineReady, SpectatorError
+from timeline import describe_summary
+
+
+# Announces game events in each tracked player's channel through the batching outbox
+class Notifier:
+    def __init__(self, outbox, bus):
+        self.outbox = outbox
+        self.bus = bus
+
+    def subscribe(self):
+        self.bus.subscribe(GameStarted, self.on_game_started)
+        self.bus.subscribe(MatchResult, self.on_match_result)
+        self.bus.subscribe(ResultUnavailable, self.on_result_unavailable)
+        self.bus.subscribe(RankChanged, self.on_rank_changed)
+        self.bus.subscribe(TimelineReady, self.on_timeline_ready)
+        self.bus.subscribe(SpectatorError, self.on_spectator_error)
+
+    async def send(self, player, content):
+        for channel_id in player.channel_ids:
+            self.outbox.post(channel_id, content)
+
+    async def on_game_started(self, event):
+        # Mention any other tracked players in the same game
+        with_others = f" with {', '.join(p.game_name for p in event.other_tracked)}" if event.other_tracked else ""
+        await self.send(event.player, f":Meditate: {event.player.game_name} is in a game now{with_others}! Monitoring... :YiStare:")
+
+    async def on_match_result(self, event):
+        name = event.player.game_name
+        result = f"{name}'s team won!" if event.participant.win else f"{name}'s team lost!"
+        await self.send(event.player, f":babyrageyi: {name}'s game just ended! {result}\n:YiLUL: Amount of times {name} died: {event.participant.deaths} :copium:")
+
+    async def on_result_unavailable(self, event):
+        await self.send(event.player, f":babyrageyi: {event.player.game_name}'s game just ended! Unable to determine match result.")
+
+    async def on_rank_changed(self, event):
+        def describe(entry):
+            return f"{entry['tier'].title()} {entry['rank']} {entry['leaguePoints']} LP" if entry else "Unranked"
+
+        change = ""
+        if event.before and (event.before['tier'], event.before['rank']) == (event.after['tier'], event.after['rank']):
+            change = f" ({event.after['leaguePoints'] - event.before['leaguePoints']:+d} LP)"
+        await self.send(event.player, f":YiStare: {event.player.game_name}'s {get_queue_type(event.queue_id)}: {describe(event.before)} -> {describe(event.after)}{change}")
+
+    async def on_timeline_ready(self, event):
+        await self.send(event.player, f":YiStare: {event.player.game_name}'s game breakdown\n{describe_summary(event.summary)}")
+
+    async def on_spectator_error(self, event):
+        for channel_id in event.player.channel_ids:
+            self.outbox.post_error(channel_id, 'spectator', f"An error occurred in the spectator check: {event.error}")
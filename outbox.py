@@ -0,0 +1,111 @@
+import asyncio
+import time
+
+from rate_limiter import Bucket, parse_limits
+from metrics import metrics
+
+BATCH_WINDOW = 2.0  # Seconds to wait for more notifications before sending a batch
+CHANNEL_SEND_LIMITS = '5:5'  # Discord's per-channel message bucket
+MAX_MESSAGE_LENGTH = 2000  # Discord's message content limit
+ERROR_COOLDOWN = 60  # Seconds before a repeated error is reported again, doubled on every repeat
+MAX_ERROR_COOLDOWN = 3600
+
+
+# Outbound notifications for one channel. Lines posted within BATCH_WINDOW of each other
+# go out as a single message, and sends are paced to stay inside Discord's channel bucket.
+class ChannelOutbox:
+    def __init__(self, client, channel_id, limits=CHANNEL_SEND_LIMITS):
+        self.client = client
+        self.channel_id = channel_id
+        self.buckets = [Bucket(limit, window) for limit, window in parse_limits(limits)]
+        self.pending = []
+        self.ready = asyncio.Event()
+        self.worker = None
+
+    def post(self, line):
+        if line not in self.pending:  # The same notice twice in one batch is noise
+            self.pending.append(line)
+        self.ready.set()
+        if self.worker is None:
+            self.worker = asyncio.create_task(self._run())
+
+    async def _run(self):
+        while True:
+            await self.ready.wait()
+            await asyncio.sleep(BATCH_WINDOW)
+            self.ready.clear()
+            lines, self.pending = self.pending, []
+            for content in split_message(lines):
+                await self._wait_for_slot()
+                try:
+                    await self.client.get_partial_messageable(self.channel_id).send(content)
+                except Exception as e:
+                    print(f"Error sending to channel {self.channel_id}: {e}")
+                    metrics.error('discord_send')
+
+    async def _wait_for_slot(self):
+        while True:
+            now = time.monotonic()
+            delay = max(bucket.wait_time(now) for bucket in self.buckets)
+            if delay <= 0:
+                for bucket in self.buckets:
+                    bucket.hit(now)
+                return
+            await asyncio.sleep(delay)
+
+
+# Join lines into as few messages as fit under Discord's length limit
+def split_message(lines):
+    messages = []
+    current = ''
+    for line in lines:
+        line = line[:MAX_MESSAGE_LENGTH]
+        if current and len(current) + 1 + len(line) > MAX_MESSAGE_LENGTH:
+            messages.append(current)
+            current = ''
+        current = f'{current}\n{line}' if current else line
+    if current:
+        messages.append(current)
+    return messages
+
+
+# Cooldown state for one recurring error in one channel
+class ErrorNotice:
+    __slots__ = ('cooldown', 'next_allowed', 'suppressed')
+
+    def __init__(self):
+        self.cooldown = ERROR_COOLDOWN
+        self.next_allowed = 0.0
+        self.suppressed = 0
+
+
+# Every channel's outbox, plus suppression of repeated error notices
+class Outbox:
+    def __init__(self, client):
+        self.client = client
+        self.channels = {}
+        self.errors = {}  # (channel id, error kind) -> ErrorNotice
+
+    def post(self, channel_id, line):
+        outbox = self.channels.get(channel_id)
+        if outbox is None:
+            outbox = self.channels[channel_id] = ChannelOutbox(self.client, channel_id)
+        outbox.post(line)
+
+    # Post an error notice unless the same kind was reported recently. Each repeat doubles
+    # the cooldown; a quiet spell longer than the cooldown resets it.
+    def post_error(self, channel_id, kind, line):
+        now = time.monotonic()
+        notice = self.errors.setdefault((channel_id, kind), ErrorNotice())
+        if now < notice.next_allowed:
+            notice.suppressed += 1
+            metrics.error('notice_suppressed')
+            return
+        if now - notice.next_allowed > notice.cooldown:
+            notice.cooldown = ERROR_COOLDOWN
+        if notice.suppressed:
+            line = f"{line} (repeated {notice.suppressed} more times)"
+        self.post(channel_id, line)
+        notice.suppressed = 0
+        notice.next_allowed = now + notice.cooldown
+        notice.cooldown = min(notice.cooldown * 2, MAX_ERROR_COOLDOWN)
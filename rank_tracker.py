@@ -0,0 +1,44 @@
+from riot_client import riot
+from rate_limiter import PRIORITY_BACKGROUND
+from events import GameStarted, MatchResult, RankChanged
+
+RANKED_QUEUES = {420: 'RANKED_SOLO_5x5', 440: 'RANKED_FLEX_SR'}  # queueId -> league-v4 queueType
+
+
+# Snapshots a player's league entry when a ranked game starts and publishes the
+# change once its result is in
+class RankTracker:
+    def __init__(self, bus):
+        self.bus = bus
+        self.before = {}  # PUUID -> (queueId, league entry or None) at game start
+
+    def subscribe(self):
+        self.bus.subscribe(GameStarted, self.on_game_started)
+        self.bus.subscribe(MatchResult, self.on_match_result)
+
+    # The player's entry for one ranked queue, or None if they are unranked in it
+    async def league_entry(self, puuid, queue_id):
+        status, entries = await riot.get('na1', f'/lol/league/v4/entries/by-puuid/{puuid}', method='league-v4.entries-by-puuid', priority=PRIORITY_BACKGROUND)
+        if status != 200:
+            raise RuntimeError(f"league-v4 returned {status}")
+        return next((e for e in entries if e['queueType'] == RANKED_QUEUES[queue_id]), None)
+
+    async def on_game_started(self, event):
+        queue_id = event.game.queue_id
+        if queue_id in RANKED_QUEUES:
+            self.before[event.player.puuid] = (queue_id, await self.league_entry(event.player.puuid, queue_id))
+
+    async def on_match_result(self, event):
+        snapshot = self.before.pop(event.player.puuid, None)
+        if snapshot is None or snapshot[0] != event.match.queue_id:
+            return
+        queue_id, before = snapshot
+        after = await self.league_entry(event.player.puuid, queue_id)
+        if after is None:
+            return
+
+        def key(entry):
+            return entry and (entry['tier'], entry['rank'], entry['leaguePoints'])
+
+        if key(before) != key(after):
+            self.bus.publish(RankChanged(event.player, queue_id, before, after))
@@ -0,0 +1,199 @@
+import asyncio
+import heapq
+import itertools
+import time
+from collections import deque
+
+# Request priorities, lower runs first
+PRIORITY_COMMAND = 0  # Someone is waiting on a slash command
+PRIORITY_BACKGROUND = 1  # Spectator polling and other background work
+
+DEFAULT_APP_LIMITS = '20:1,100:120'  # Development key limits, replaced by X-App-Rate-Limit once Riot reports them
+DEFAULT_RETRY_AFTER = 1  # Seconds to back off on a 429 that carries no Retry-After header
+
+
+# Parse a Riot limit header such as "20:1,100:120" into [(20, 1), (100, 120)]
+def parse_limits(header):
+    limits = []
+    for part in header.split(','):
+        count, window = part.strip().split(':')
+        limits.append((int(count), int(window)))
+    return limits
+
+
+# Sliding-window bucket: at most `limit` requests in any `window` seconds
+class Bucket:
+    __slots__ = ('limit', 'window', 'hits')
+
+    def __init__(self, limit, window, hits=None):
+        self.limit = limit
+        self.window = window
+        self.hits = hits if hits is not None else deque()
+
+    # Seconds until this bucket can take another request (0 if it can right now)
+    def wait_time(self, now):
+        while self.hits and now - self.hits[0] >= self.window:
+            self.hits.popleft()
+        if len(self.hits) < self.limit:
+            return 0
+        return self.hits[-self.limit] + self.window - now
+
+    def hit(self, now):
+        self.hits.append(now)
+
+    # Riot's count header is authoritative, catch up if it saw requests we did not
+    def sync(self, count, now):
+        while len(self.hits) < count:
+            self.hits.append(now)
+
+
+# One call waiting for a slot. Ordered by priority, then arrival; the priority can be
+# raised while it waits, e.g. when a command joins a background fetch.
+class Waiter:
+    __slots__ = ('method', 'priority', 'order')
+    _orders = itertools.count()
+
+    def __init__(self, method, priority=PRIORITY_COMMAND):
+        self.method = method
+        self.priority = priority
+        self.order = next(Waiter._orders)
+
+    def __lt__(self, other):
+        return (self.priority, self.order) < (other.priority, other.order)
+
+
+# Rebuild a bucket list from new limits, keeping the history of windows that still exist
+def rebuild_buckets(buckets, limits):
+    history = {bucket.window: bucket.hits for bucket in buckets}
+    return [Bucket(limit, window, history.get(window)) for limit, window in limits]
+
+
+def sync_buckets(buckets, counts, now):
+    by_window = {bucket.window: bucket for bucket in buckets}
+    for count, window in counts:
+        bucket = by_window.get(window)
+        if bucket:
+            bucket.sync(count, now)
+
+
+# Central scheduler for one Riot routing value (limits are enforced per region).
+# Every outgoing call acquires a slot here first; waiters are served in priority
+# order so interactive commands jump ahead of background polling. When several
+# processes share the API key, each runs with `share` of Riot's limits.
+class RateLimiter:
+    def __init__(self, app_limits=DEFAULT_APP_LIMITS, share=1.0):
+        self.share = share
+        self.app_limits = app_limits
+        self.app_buckets = rebuild_buckets([], self._scaled(app_limits))
+        self.method_limits = {}
+        self.method_buckets = {}
+        self.blocked_until = 0.0  # App-wide 429 back-off
+        self.method_blocked_until = {}  # Per-method 429 back-off
+        self._waiters = []
+        self._wakeup = asyncio.Event()
+
+    # Parse a limit or count header and scale it to this process's share
+    def _scaled(self, header, minimum=1):
+        return [(max(minimum, int(count * self.share)), window) for count, window in parse_limits(header)]
+
+    # Change this process's share of the limits, e.g. when a worker joins or leaves
+    def set_share(self, share):
+        if share == self.share:
+            return
+        self.share = share
+        self.app_buckets = rebuild_buckets(self.app_buckets, self._scaled(self.app_limits))
+        for method, limits in self.method_limits.items():
+            self.method_buckets[method] = rebuild_buckets(self.method_buckets[method], self._scaled(limits))
+        self._notify()
+
+    # Seconds until any call may go out, shared by every method
+    def _app_delay(self, now):
+        delays = [self.blocked_until - now]
+        delays.extend(bucket.wait_time(now) for bucket in self.app_buckets)
+        return max(delays)
+
+    # Seconds until `method` itself has budget again, ignoring the app-wide limits
+    def _method_delay(self, method, now):
+        delays = [self.method_blocked_until.get(method, 0) - now]
+        delays.extend(bucket.wait_time(now) for bucket in self.method_buckets.get(method, ()))
+        return max(delays)
+
+    # Wake every waiter so the new head of the queue can re-check its budget
+    def _notify(self):
+        self._wakeup.set()
+        self._wakeup = asyncio.Event()
+
+    async def _sleep(self, delay):
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), delay)
+        except asyncio.TimeoutError:
+            pass
+
+    # Wait until `method` may be called without exceeding any known limit. The app-wide
+    # budget goes to waiters in priority order, skipping any whose own method is out of
+    # budget so one method's limit never holds up calls to the others.
+    async def acquire(self, method, priority=PRIORITY_COMMAND, waiter=None):
+        entry = waiter or Waiter(method, priority)
+        heapq.heappush(self._waiters, entry)
+        try:
+            while True:
+                now = time.monotonic()
+                delay = self._method_delay(method, now)
+                if delay <= 0:
+                    ready = min(waiter for waiter in self._waiters if self._method_delay(waiter.method, now) <= 0)
+                    delay = self._app_delay(now) if ready is entry else None
+                    if delay is not None and delay <= 0:
+                        self._waiters.remove(entry)
+                        heapq.heapify(self._waiters)
+                        for bucket in self.app_buckets:
+                            bucket.hit(now)
+                        for bucket in self.method_buckets.get(method, ()):
+                            bucket.hit(now)
+                        self._notify()
+                        return
+                await self._sleep(delay)
+        except BaseException:
+            if entry in self._waiters:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+                self._notify()
+            raise
+
+    # Move a waiter up to `priority` if that is more urgent than its own
+    def raise_priority(self, waiter, priority):
+        if priority < waiter.priority:
+            waiter.priority = priority
+            if waiter in self._waiters:
+                heapq.heapify(self._waiters)
+                self._notify()
+
+    # Feed the rate limit headers of a response back into the buckets
+    def update(self, method, status, headers):
+        now = time.monotonic()
+
+        app_limits = headers.get('X-App-Rate-Limit')
+        if app_limits and app_limits != self.app_limits:
+            self.app_limits = app_limits
+            self.app_buckets = rebuild_buckets(self.app_buckets, self._scaled(app_limits))
+        # Counts are for the whole key, so only this process's share of them is caught up on
+        app_counts = headers.get('X-App-Rate-Limit-Count')
+        if app_counts:
+            sync_buckets(self.app_buckets, self._scaled(app_counts, 0), now)
+
+        method_limits = headers.get('X-Method-Rate-Limit')
+        if method_limits and method_limits != self.method_limits.get(method):
+            self.method_limits[method] = method_limits
+            self.method_buckets[method] = rebuild_buckets(self.method_buckets.get(method, []), self._scaled(method_limits))
+        method_counts = headers.get('X-Method-Rate-Limit-Count')
+        if method_counts:
+            sync_buckets(self.method_buckets.get(method, []), self._scaled(method_counts, 0), now)
+
+        if status == 429:
+            retry_after = float(headers.get('Retry-After', DEFAULT_RETRY_AFTER))
+            if headers.get('X-Rate-Limit-Type') == 'method':
+                self.method_blocked_until[method] = max(self.method_blocked_until.get(method, 0), now + retry_after)
+            else:
+                self.blocked_until = max(self.blocked_until, now + retry_after)
+            print(f"\033[93mRiot rate limit hit on {method}, backing off {retry_after:.0f}s\033[0m")
+
+        self._notify()
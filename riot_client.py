@@ -0,0 +1,134 @@
+import asyncio
+import time
+
+import aiohttp
+
+from rate_limiter import RateLimiter, Waiter, PRIORITY_COMMAND
+from metrics import metrics
+from json_codec import decode
+
+RIOT_API_KEY = '<personal API key>'
+
+# Regional hosts used by the bot. Platform routing (na1) serves spectator/summoner
+# endpoints, regional routing (americas) serves account and match-v5.
+HOSTS = {
+    'na1': 'https://na1.api.riotgames.com',
+    'americas': 'https://americas.api.riotgames.com',
+}
+
+REQUEST_TIMEOUT = 30  # Seconds before a single Riot call is abandoned
+POOL_SIZE = 20  # Max open connections per regional host
+KEEPALIVE_TIMEOUT = 60  # Seconds an idle connection stays open for reuse
+DNS_CACHE_TTL = 300  # Seconds resolved Riot hostnames are cached
+MAX_RETRIES = 3  # Extra attempts after a 429
+SPECTATOR_CACHE_TTL = 10  # Seconds a spectator-v5 response is reused by other callers
+MAX_CACHED_RESPONSES = 1000  # Expired short-TTL responses are swept once this many are held
+
+
+# One long-lived client shared by every module. Each regional host gets its own
+# session so its connection pool, keep-alive and DNS cache are reused across calls
+# instead of paying a new TCP+TLS handshake for every request.
+class RiotClient:
+    def __init__(self, api_key=RIOT_API_KEY, hosts=None):
+        self.api_key = api_key
+        self.hosts = dict(hosts or HOSTS)
+        self._sessions = {}
+        # Riot enforces limits per routing value, so each host gets its own scheduler
+        self.limiters = {region: RateLimiter() for region in self.hosts}
+        self._inflight = {}  # Request key -> (task fetching it, its rate limit waiter), shared by concurrent identical calls
+        self._responses = {}  # Request key -> (expires at, status, data) for short-TTL reuse
+
+    # Open one pooled session per regional host
+    async def open(self):
+        for region in self.hosts:
+            self._session(region)
+
+    # Close every pooled session
+    async def close(self):
+        sessions, self._sessions = self._sessions, {}
+        for session in sessions.values():
+            await session.close()
+
+    def _session(self, region):
+        session = self._sessions.get(region)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=POOL_SIZE,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=DNS_CACHE_TTL,
+            )
+            session = aiohttp.ClientSession(
+                base_url=self.hosts[region],
+                connector=connector,
+                headers={"X-Riot-Token": self.api_key},
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+            )
+            self._sessions[region] = session
+        return session
+
+    # GET a Riot endpoint and return (status, decoded JSON or None).
+    # `method` names the endpoint for per-method rate limits, `priority` orders the wait queue.
+    # Concurrent identical requests share a single call; with `cache_ttl` the result is also
+    # reused for that many seconds. `reader` replaces the JSON decode with an async function
+    # of the response, for bodies that should be consumed as a stream.
+    async def get(self, region, path, params=None, method=None, priority=PRIORITY_COMMAND, cache_ttl=0, reader=None):
+        key = (region, path, tuple(sorted(params.items())) if params else (), reader)
+        if cache_ttl:
+            cached = self._responses.get(key)
+            fresh = cached is not None and cached[0] > time.monotonic()
+            metrics.cache_lookup('response', fresh)
+            if fresh:
+                return cached[1], cached[2]
+
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            # The fetch runs as its own task so one caller giving up doesn't cancel it for the rest
+            waiter = Waiter(method or path, priority)
+            task = asyncio.ensure_future(self._fetch(region, path, params, waiter, reader))
+            self._inflight[key] = task, waiter
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            task, waiter = inflight
+            # A command joining a queued background fetch shouldn't wait at background priority
+            self.limiters[region].raise_priority(waiter, priority)
+            metrics.coalesced(method or path)
+        status, data = await asyncio.shield(task)
+
+        if cache_ttl and status in (200, 404):
+            self._remember(key, status, data, cache_ttl)
+        return status, data
+
+    def _remember(self, key, status, data, ttl):
+        now = time.monotonic()
+        if len(self._responses) >= MAX_CACHED_RESPONSES:
+            self._responses = {k: v for k, v in self._responses.items() if v[0] > now}
+        self._responses[key] = (now + ttl, status, data)
+
+    async def _fetch(self, region, path, params, waiter, reader=None):
+        session = self._session(region)
+        limiter = self.limiters[region]
+        method = waiter.method
+        for attempt in range(MAX_RETRIES + 1):
+            await limiter.acquire(method, waiter=waiter)
+            started = time.perf_counter()
+            try:
+                async with session.get(path, params=params) as response:
+                    limiter.update(method, response.status, response.headers)
+                    if response.status == 429 and attempt < MAX_RETRIES:
+                        metrics.observe_riot_call(method, response.status, time.perf_counter() - started)
+                        continue
+                    if response.status != 200:
+                        data = None
+                    elif reader is not None:
+                        data = await reader(response)
+                    else:
+                        data = await decode(await response.read(), method)
+                    metrics.observe_riot_call(method, response.status, time.perf_counter() - started)
+                    return response.status, data
+            except Exception:
+                metrics.observe_riot_call(method, 'error', time.perf_counter() - started)
+                raise
+
+
+# Shared instance, opened in bot.py at startup and closed on shutdown
+riot = RiotClient()
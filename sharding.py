@@ -0,0 +1,118 @@
+import asyncio
+import bisect
+import hashlib
+import os
+import sqlite3
+import time
+
+from match_cache import CACHE_DIR
+from riot_client import riot
+from tracking import registry
+from metrics import metrics
+
+COORDINATION_PATH = os.path.join(CACHE_DIR, 'coordination.sqlite3')
+HEARTBEAT_INTERVAL = 10  # Seconds between worker heartbeats
+WORKER_TIMEOUT = 30  # A worker missing heartbeats for this long is considered gone
+RING_REPLICAS = 100  # Virtual nodes per worker on the hash ring
+LEASE_MARGIN = 60  # Seconds a poll lease outlives the poll's scheduled gap
+
+
+def _hash(key):
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), 'big')
+
+
+# Consistent hash ring: each player maps to one worker, and a worker joining or leaving
+# only moves the players on its own arcs
+class HashRing:
+    def __init__(self, workers, replicas=RING_REPLICAS):
+        self.workers = sorted(workers)
+        points = sorted((_hash(f'{worker}-{i}'), worker) for worker in self.workers for i in range(replicas))
+        self._keys = [point for point, _ in points]
+        self._owners = [worker for _, worker in points]
+
+    def owner(self, key):
+        if not self._keys:
+            return None
+        index = bisect.bisect(self._keys, _hash(key)) % len(self._keys)
+        return self._owners[index]
+
+
+# Worker membership and poll leases in a SQLite file every worker process opens. Workers
+# heartbeat into it, build the same hash ring from the live set, and take a lease on a
+# player before polling it so a player is never polled by two workers while the ring changes.
+class Coordinator:
+    def __init__(self, worker_id, path=COORDINATION_PATH):
+        self.worker_id = worker_id
+        self.path = path
+        self.ring = HashRing([worker_id])
+        self._db = None
+
+    def _connect(self):
+        if self._db is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            self._db = sqlite3.connect(self.path, timeout=10)
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute('CREATE TABLE IF NOT EXISTS workers (worker_id INTEGER PRIMARY KEY, pid INTEGER NOT NULL, heartbeat REAL NOT NULL)')
+            self._db.execute('CREATE TABLE IF NOT EXISTS leases (puuid TEXT PRIMARY KEY, worker_id INTEGER NOT NULL, expires REAL NOT NULL)')
+            self._db.commit()
+        return self._db
+
+    # Record that this worker is alive and rebuild the ring from every live worker
+    def heartbeat(self):
+        db = self._connect()
+        now = time.time()
+        db.execute('INSERT OR REPLACE INTO workers (worker_id, pid, heartbeat) VALUES (?, ?, ?)', (self.worker_id, os.getpid(), now))
+        db.execute('DELETE FROM workers WHERE heartbeat < ?', (now - WORKER_TIMEOUT,))
+        db.commit()
+        workers = sorted(row[0] for row in db.execute("SELECT worker_id FROM workers"))
+        if workers != self.ring.workers:
+            print(f"\033[36mWorker {self.worker_id}: live workers now {workers}\033[0m")
+            self.ring = HashRing(workers)
+        # Every live worker gets an equal slice of the Riot rate limits
+        for limiter in riot.limiters.values():
+            limiter.set_share(1 / len(workers))
+
+    def owns(self, puuid):
+        return self.ring.owner(puuid) == self.worker_id
+
+    # Take or extend this worker's lease on a player for `seconds`. False if another worker holds it.
+    def claim(self, puuid, seconds):
+        db = self._connect()
+        now = time.time()
+        cursor = db.execute(
+            'INSERT INTO leases (puuid, worker_id, expires) VALUES (?, ?, ?) '
+            'ON CONFLICT (puuid) DO UPDATE SET worker_id = excluded.worker_id, expires = excluded.expires '
+            'WHERE leases.worker_id = excluded.worker_id OR leases.expires < ?',
+            (puuid, self.worker_id, now + seconds + LEASE_MARGIN, now),
+        )
+        db.commit()
+        return cursor.rowcount > 0
+
+    def release(self, puuid):
+        db = self._connect()
+        db.execute('DELETE FROM leases WHERE puuid = ? AND worker_id = ?', (puuid, self.worker_id))
+        db.commit()
+
+    # Heartbeat forever, picking up players tracked or untracked by other workers
+    async def run(self):
+        while True:
+            try:
+                self.heartbeat()
+                registry.reload_if_changed()
+            except sqlite3.Error as e:
+                print(f"Coordination store error: {e}")
+                metrics.error('coordination')
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
+
+    def close(self):
+        if self._db is not None:
+            self._db.execute('DELETE FROM workers WHERE worker_id = ?', (self.worker_id,))
+            self._db.execute('DELETE FROM leases WHERE worker_id = ?', (self.worker_id,))
+            self._db.commit()
+            self._db.close()
+            self._db = None
+
+
+# Shard ids a worker's AutoShardedClient runs when `shard_count` shards are split over `worker_count` workers
+def shard_ids_for(worker_id, worker_count, shard_count):
+    return [shard_id for shard_id in range(shard_count) if shard_id % worker_count == worker_id]
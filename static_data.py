@@ -0,0 +1,151 @@
+import asyncio
+import json
+import os
+import sys
+from dataclasses import dataclass
+
+STATIC_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static_data')  # Holds one directory per Data Dragon version plus emojis.json
+EMOJI_OVERLAY_FILE = 'emojis.json'
+STATIC_DATA_CHECK_INTERVAL = 600  # Seconds between checks for a newer patch directory
+
+UNKNOWN_CHAMPION = "Unknown Champion"
+UNKNOWN_QUEUE = "Unknown Queue"
+UNKNOWN_SPELL = "Unknown Spell"
+CHAMPION_ICON_URL = "https://cdn.communitydragon.org/latest/champion/{champion_id}/square"
+
+
+# Everything embeds show about a champion, formatted once per static data load.
+# Records are shared by reference, so rendering never builds or splits strings.
+@dataclass(frozen=True, slots=True)
+class Champion:
+    id: int
+    name: str
+    emoji: str
+    icon_url: str
+    display: str  # "<emoji> Name"
+    bold_display: str  # "<emoji> __**Name**__", used for the tracked player's own pick
+
+    @classmethod
+    def build(cls, champion_id, name, emoji):
+        name = sys.intern(name)
+        return cls(
+            id=champion_id,
+            name=name,
+            emoji=sys.intern(emoji),
+            icon_url=CHAMPION_ICON_URL.format(champion_id=champion_id),
+            display=f"{emoji} {name}",
+            bold_display=f"{emoji} __**{name}**__",
+        )
+
+
+# Sort key for Data Dragon version directories ("14.19.1" < "14.20.1"), None if not a version
+def version_key(version):
+    parts = version.split('.')
+    if not all(part.isdigit() for part in parts):
+        return None
+    return tuple(int(part) for part in parts)
+
+
+# Newest version directory in the static data folder, or None
+def latest_version(directory=STATIC_DATA_DIR):
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return None
+    versions = [name for name in names if version_key(name) and os.path.isdir(os.path.join(directory, name))]
+    return max(versions, key=version_key, default=None)
+
+
+def _read_json(path, default):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+# Lookup tables for one patch, built once per load
+class StaticData:
+    def __init__(self, version, champions, queues, summoner_spells, emojis):
+        self.version = version
+
+        default_champion_emoji = emojis.get('default_champion', '')
+        champion_emojis = emojis.get('champions', {})
+        self.champions = {}
+        for champion in champions.get('data', {}).values():
+            champion_id = int(champion['key'])
+            emoji = champion_emojis.get(champion['key'], default_champion_emoji)
+            self.champions[champion_id] = Champion.build(champion_id, champion['name'], emoji)
+        self.default_champion_emoji = default_champion_emoji
+
+        self.queue_types = {queue['queueId']: queue.get('description') or UNKNOWN_QUEUE for queue in queues}
+
+        default_spell_emoji = emojis.get('default_summoner_spell', '')
+        spell_emojis = emojis.get('summoner_spells', {})
+        self.summoner_spells = {
+            int(spell['key']): (spell_emojis.get(spell['key'], default_spell_emoji), spell['name'])
+            for spell in summoner_spells.get('data', {}).values()
+        }
+        self.unknown_spell = (default_spell_emoji, UNKNOWN_SPELL)
+
+    def champion(self, champion_id):
+        champion = self.champions.get(champion_id)
+        if champion is None:
+            # Champion newer than this patch's files, remember a placeholder that still has its icon
+            champion = self.champions[champion_id] = Champion.build(champion_id, UNKNOWN_CHAMPION, self.default_champion_emoji)
+        return champion
+
+    @classmethod
+    def load(cls, directory=STATIC_DATA_DIR, version=None):
+        version = version or latest_version(directory)
+        version_dir = os.path.join(directory, version) if version else directory
+        return cls(
+            version,
+            _read_json(os.path.join(version_dir, 'champion.json'), {}),
+            _read_json(os.path.join(version_dir, 'queues.json'), []),
+            _read_json(os.path.join(version_dir, 'summoner.json'), {}),
+            _read_json(os.path.join(directory, EMOJI_OVERLAY_FILE), {}),
+        )
+
+
+# Tables in use right now. Reloads build a complete new StaticData and swap this reference,
+# so a lookup never sees a half-loaded patch.
+current = StaticData.load()
+
+
+# Load the newest patch directory if it differs from the one in use
+def reload_if_changed(directory=STATIC_DATA_DIR):
+    global current
+    version = latest_version(directory)
+    if version and version != current.version:
+        current = StaticData.load(directory, version)
+        print(f"\033[32mLoaded static data for patch {version}\033[0m")
+        return True
+    return False
+
+
+# Background task picking up new patch directories as they are dropped in
+async def watch_static_data():
+    while True:
+        await asyncio.sleep(STATIC_DATA_CHECK_INTERVAL)
+        try:
+            reload_if_changed()
+        except Exception as e:
+            print(f"Error: {e}")
+
+
+# Champion record for an id, returned by reference
+def get_champion(champion_id):
+    return current.champion(champion_id)
+
+
+def get_champion_name(champion_id):
+    return get_champion(champion_id).display
+
+
+def get_queue_type(queue_id):
+    return current.queue_types.get(queue_id, UNKNOWN_QUEUE)
+
+
+def get_summoner_spell_name(spell_id):
+    return current.summoner_spells.get(spell_id, current.unknown_spell)
@@ -0,0 +1,113 @@
+import asyncio
+import os
+
+import pytest
+
+import match_history
+from benchmarks import fixtures
+from match_cache import match_cache
+from warehouse import Warehouse, SYNC_BATCH, MAX_DOWNLOAD_FAILURES
+
+PUUID = 'test-puuid'
+
+
+# Stands in for the Riot client: a player's match-v5 history, newest first, that tests can add games to
+class FakeRiot:
+    def __init__(self, games):
+        self.games = games  # [(match id, gameCreation in epoch ms)], newest first
+        self.detail_calls = 0
+        self.missing = set()  # Match ids whose details 404
+
+    def play(self, count):
+        newest = self.games[0][1] if self.games else 1700000000000
+        number = len(self.games)
+        self.games[:0] = [(f'NA1_{number + i}', newest + (i + 1) * 60_000) for i in reversed(range(count))]
+
+    async def get(self, region, path, params=None, **kwargs):
+        if path.endswith('/ids'):
+            start_time, end_time = params.get('startTime'), params.get('endTime')
+            ids = [match_id for match_id, created in self.games
+                   if (start_time is None or created // 1000 >= start_time) and (end_time is None or created // 1000 <= end_time)]
+            return 200, ids[params['start']:params['start'] + params['count']]
+        self.detail_calls += 1
+        match_id = path.rsplit('/', 1)[1]
+        if match_id in self.missing:
+            return 404, None
+        payload = fixtures.match(match_id, PUUID)
+        payload['info']['gameCreation'] = dict(self.games)[match_id]
+        return 200, payload
+
+
+@pytest.fixture
+def riot(monkeypatch):
+    fake = FakeRiot([])
+    monkeypatch.setattr(match_history, 'riot', fake)
+    return fake
+
+
+@pytest.fixture
+def warehouse(tmp_path):
+    match_cache.close()
+    match_cache.path = os.path.join(tmp_path, 'matches.sqlite3')
+    warehouse = Warehouse(os.path.join(tmp_path, 'history.sqlite3'))
+    yield warehouse
+    warehouse.close()
+    match_cache.close()
+
+
+def stored_ids(warehouse):
+    return {row[0] for row in warehouse.query('SELECT match_id FROM matches')}
+
+
+def test_sync_catches_up_on_more_than_a_batch_of_new_games(riot, warehouse):
+    riot.play(30)
+    asyncio.run(warehouse.sync_player(PUUID))
+    riot.play(SYNC_BATCH + 50)
+
+    # The first sync stores the oldest new games, so the synced range has no holes
+    asyncio.run(warehouse.sync_player(PUUID))
+    oldest_new = {match_id for match_id, _ in riot.games[50:]}
+    assert stored_ids(warehouse) == oldest_new
+    assert warehouse.sync_state(PUUID).newest == riot.games[50][1]
+
+    asyncio.run(warehouse.sync_player(PUUID))
+    assert stored_ids(warehouse) == {match_id for match_id, _ in riot.games}
+    assert warehouse.sync_state(PUUID).newest == riot.games[0][1]
+
+
+def test_sync_downloads_at_most_a_batch(riot, warehouse):
+    riot.play(10)
+    asyncio.run(warehouse.sync_player(PUUID))
+    riot.play(60)
+    riot.detail_calls = 0
+
+    asyncio.run(warehouse.sync_player(PUUID, batch=20))
+    assert riot.detail_calls == 20
+    assert len(stored_ids(warehouse)) == 30
+
+
+def test_sync_moves_past_a_match_that_never_downloads(riot, warehouse):
+    riot.play(10)
+    asyncio.run(warehouse.sync_player(PUUID))
+    riot.play(10)
+    bad_id, bad_created = riot.games[5]
+    riot.missing.add(bad_id)
+
+    # Until it is given up on, `newest` stops just short of the failed match so it is retried
+    for _ in range(MAX_DOWNLOAD_FAILURES):
+        assert warehouse.sync_state(PUUID).newest < bad_created
+        asyncio.run(warehouse.sync_player(PUUID))
+    assert warehouse.sync_state(PUUID).newest == riot.games[0][1]
+
+    riot.play(5)
+    asyncio.run(warehouse.sync_player(PUUID))
+    assert stored_ids(warehouse) == {match_id for match_id, _ in riot.games} - {bad_id}
+
+
+def test_backfill_reaches_the_start_of_the_history(riot, warehouse):
+    riot.play(45)
+    asyncio.run(warehouse.sync_player(PUUID, batch=10))
+    while not warehouse.sync_state(PUUID).complete:
+        asyncio.run(warehouse.backfill(PUUID, batch=10))
+    assert stored_ids(warehouse) == {match_id for match_id, _ in riot.games}
+    assert warehouse.sync_state(PUUID).oldest == riot.games[-1][1]
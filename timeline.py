@@ -0,0 +1,129 @@
+from riot_client import riot
+from rate_limiter import PRIORITY_BACKGROUND
+from match_cache import match_cache
+from match_history import get_match_details
+from events import MatchResult, TimelineReady
+from json_codec import decode
+
+try:
+    import ijson
+except ImportError:  # Optional, without it the timeline body is decoded in one piece
+    ijson = None
+
+OBJECTIVE_EVENTS = ('ELITE_MONSTER_KILL', 'BUILDING_KILL')  # Dragons, barons, heralds, grubs, towers, inhibitors
+DIFF_MINUTES = (10, 15)  # Minutes whose gold/CS/XP difference is shown
+
+
+# Boils a match-v5 timeline down to what the post-game summary needs, one frame at a time,
+# so the multi-megabyte document never has to be held in memory whole
+class TimelineReducer:
+    def __init__(self):
+        self.gold = {}  # participantId -> totalGold at each minute
+        self.xp = {}
+        self.cs = {}
+        self.deaths = {}  # participantId -> seconds into the game of each death
+        self.objectives = []  # (team that took it, participantIds involved)
+
+    def add_frame(self, frame):
+        for participant_id, stats in frame['participantFrames'].items():
+            participant_id = int(participant_id)
+            self.gold.setdefault(participant_id, []).append(int(stats['totalGold']))
+            self.xp.setdefault(participant_id, []).append(int(stats['xp']))
+            self.cs.setdefault(participant_id, []).append(int(stats['minionsKilled']) + int(stats['jungleMinionsKilled']))
+
+        for event in frame.get('events', ()):
+            event_type = event['type']
+            if event_type == 'CHAMPION_KILL':
+                self.deaths.setdefault(int(event['victimId']), []).append(int(event['timestamp']) // 1000)
+            elif event_type in OBJECTIVE_EVENTS:
+                # Buildings carry the team that lost them, monsters the team that took them
+                team_id = 300 - int(event['teamId']) if event_type == 'BUILDING_KILL' else int(event['killerTeamId'])
+                involved = [int(event.get('killerId', 0))] + [int(p) for p in event.get('assistingParticipantIds', ())]
+                self.objectives.append((team_id, involved))
+
+
+# Response reader for riot.get: pull only the frames out of the timeline body
+async def read_timeline(response):
+    reducer = TimelineReducer()
+    if ijson is not None:
+        async for frame in ijson.items_async(response.content, 'info.frames.item'):
+            reducer.add_frame(frame)
+    else:
+        for frame in (await decode(await response.read()))['info']['frames']:
+            reducer.add_frame(frame)
+    return reducer
+
+
+# Per-player summary of a reduced timeline, keyed by PUUID: per-minute gold/XP/CS difference to the
+# lane opponent (or the enemy team's average when positions are unknown, as in ARAM), death times
+# and how many of the team's objectives the player was involved in
+def summarize(payload, reducer):
+    participants = payload['info']['participants']
+    summary = {}
+    for player in participants:
+        participant_id = player['participantId']
+        position = player.get('teamPosition')
+        enemies = [p for p in participants if p['teamId'] != player['teamId']]
+        opponent = next((p for p in enemies if position and p.get('teamPosition') == position), None)
+        against = [opponent] if opponent else enemies
+
+        def diff(series):
+            own = series.get(participant_id, [])
+            theirs = [series.get(p['participantId'], []) for p in against]
+            return [value - round(sum(other[i] for other in theirs if i < len(other)) / len(theirs)) for i, value in enumerate(own)]
+
+        team_objectives = [involved for team_id, involved in reducer.objectives if team_id == player['teamId']]
+        summary[player['puuid']] = {
+            'opponent': opponent['puuid'] if opponent else None,
+            'gold_diff': diff(reducer.gold),
+            'xp_diff': diff(reducer.xp),
+            'cs_diff': diff(reducer.cs),
+            'deaths': reducer.deaths.get(participant_id, []),
+            'objectives_taken': len(team_objectives),
+            'objectives_joined': sum(participant_id in involved for involved in team_objectives),
+        }
+    return summary
+
+
+# Short text form of one player's summary for notifications and match embeds
+def describe_summary(summary):
+    against = "lane opponent" if summary['opponent'] else "enemy average"
+    diffs = [
+        f"@{minute}: {summary['gold_diff'][minute]:+d}g {summary['cs_diff'][minute]:+d}cs {summary['xp_diff'][minute]:+d}xp"
+        for minute in DIFF_MINUTES if minute < len(summary['gold_diff'])
+    ]
+    deaths = ', '.join(f"{seconds // 60}:{seconds % 60:02d}" for seconds in summary['deaths']) or "never"
+    lines = [f"vs {against} {' • '.join(diffs)}"] if diffs else []
+    lines.append(f"Died at {deaths}")
+    lines.append(f"In on {summary['objectives_joined']}/{summary['objectives_taken']} team objectives")
+    return '\n'.join(lines)
+
+
+# Timeline summary for a finished match, computed once and then served from the match cache
+async def get_timeline_summary(match_id, priority=PRIORITY_BACKGROUND):
+    cached = match_cache.get_timeline_summary(match_id)
+    if cached is not None:
+        return cached
+    payload = await get_match_details(match_id, priority=priority)
+    if payload is None:
+        return None
+    status, reducer = await riot.get('americas', f'/lol/match/v5/matches/{match_id}/timeline', method='match-v5.timeline', priority=priority, reader=read_timeline)
+    if status != 200:
+        return None
+    summary = summarize(payload, reducer)
+    match_cache.put_timeline_summary(match_id, summary)
+    return summary
+
+
+# Optional post-game stage: summarize the timeline of every finished tracked game
+class TimelineAnalyzer:
+    def __init__(self, bus):
+        self.bus = bus
+
+    def subscribe(self):
+        self.bus.subscribe(MatchResult, self.on_match_result)
+
+    async def on_match_result(self, event):
+        summary = await get_timeline_summary(event.match.match_id)
+        if summary and event.player.puuid in summary:
+            self.bus.publish(TimelineReady(event.player, event.match.match_id, summary[event.player.puuid]))
@@ -0,0 +1,200 @@
+import json
+import os
+import sqlite3
+from dataclasses import dataclass, field
+
+from events import ALLOWED_TRANSITIONS, GamePhase
+from match_cache import CACHE_DIR
+
+TRACKED_PLAYERS_PATH = os.path.join(CACHE_DIR, 'players.sqlite3')
+LEGACY_PLAYERS_PATH = 'tracked_players.json'  # Where players were kept before the database, imported on first start
+
+SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS players (puuid TEXT PRIMARY KEY, game_name TEXT NOT NULL, tag_line TEXT NOT NULL)',
+    'CREATE TABLE IF NOT EXISTS player_channels ('
+    'puuid TEXT NOT NULL REFERENCES players (puuid), channel_id INTEGER NOT NULL, PRIMARY KEY (puuid, channel_id))',
+    # Games started per local hour of day, counted with single-statement upserts
+    'CREATE TABLE IF NOT EXISTS player_hours ('
+    'puuid TEXT NOT NULL REFERENCES players (puuid), hour INTEGER NOT NULL, games INTEGER NOT NULL, PRIMARY KEY (puuid, hour))',
+)
+
+
+# A Riot account being watched and the Discord channels its notifications go to
+@dataclass(slots=True)
+class TrackedPlayer:
+    game_name: str
+    tag_line: str
+    puuid: str
+    channel_ids: list  # Every channel (in any guild) that tracked this player
+    play_hours: list = field(default_factory=lambda: [0] * 24)  # Games started per local hour of day
+
+    @property
+    def riot_id(self):
+        return f'{self.game_name}#{self.tag_line}'
+
+
+# Spectator state for one tracked player
+@dataclass(slots=True)
+class PlayerState:
+    phase: GamePhase = GamePhase.IDLE
+    game_id: int = None
+    platform_id: str = None
+    queue_id: int = None
+    game_length: int = 0  # gameLength reported by the last spectator poll
+    polled_at: float = 0.0  # time.monotonic() of the last spectator poll
+    last_game_end: float = 0.0  # time.monotonic() the last game was seen ending
+
+    @property
+    def in_game(self):
+        return self.phase is GamePhase.IN_GAME
+
+    # Move to a new phase, refusing jumps the state machine doesn't allow
+    def transition(self, phase):
+        if phase not in ALLOWED_TRANSITIONS[self.phase]:
+            raise ValueError(f"Invalid game phase transition {self.phase.value} -> {phase.value}")
+        self.phase = phase
+
+
+# Every tracked player plus their state, keyed by PUUID. Players live in SQLite so several bot
+# worker processes can track, untrack and count games at once without losing each other's writes;
+# each process keeps an in-memory copy, reloaded when another one commits a change.
+class PlayerRegistry:
+    def __init__(self, path=TRACKED_PLAYERS_PATH):
+        self.path = path
+        self.players = {}
+        self.states = {}
+        self.listeners = []  # Called whenever players are tracked or untracked
+        self._db = None
+        self._version = None  # Connects lazily like the other stores, bot.py loads the players at startup
+
+    def _connect(self):
+        if self._db is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            self._db = sqlite3.connect(self.path, timeout=10)
+            self._db.execute('PRAGMA journal_mode=WAL')
+            for statement in SCHEMA:
+                self._db.execute(statement)
+            self._db.commit()
+            self._import_legacy()
+        return self._db
+
+    # Bring players saved to tracked_players.json by older versions into the database, once
+    def _import_legacy(self):
+        if self._db.execute('SELECT EXISTS (SELECT 1 FROM players)').fetchone()[0]:
+            return
+        try:
+            with open(LEGACY_PLAYERS_PATH) as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return
+        with self._db:
+            for entry in entries:
+                channel_ids = entry.get('channel_ids') or [entry.get('channel_id')]
+                self._insert(entry['game_name'], entry['tag_line'], entry['puuid'], channel_ids)
+                self._db.executemany(
+                    'INSERT OR REPLACE INTO player_hours (puuid, hour, games) VALUES (?, ?, ?)',
+                    [(entry['puuid'], hour, games) for hour, games in enumerate(entry.get('play_hours', [])) if games],
+                )
+
+    def _insert(self, game_name, tag_line, puuid, channel_ids):
+        self._db.execute('INSERT OR IGNORE INTO players (puuid, game_name, tag_line) VALUES (?, ?, ?)', (puuid, game_name, tag_line))
+        self._db.executemany('INSERT OR IGNORE INTO player_channels (puuid, channel_id) VALUES (?, ?)', [(puuid, c) for c in channel_ids])
+
+    # Read every player from the database. Player objects and states of players still tracked
+    # are updated in place, so polls already holding them keep working.
+    def load(self):
+        db = self._connect()
+        self._version = db.execute('PRAGMA data_version').fetchone()[0]
+        players = {}
+        for puuid, game_name, tag_line in db.execute('SELECT puuid, game_name, tag_line FROM players'):
+            player = self.players.get(puuid) or TrackedPlayer(game_name, tag_line, puuid, [])
+            player.game_name, player.tag_line = game_name, tag_line
+            player.channel_ids = []
+            player.play_hours = [0] * 24
+            players[puuid] = player
+        for puuid, channel_id in db.execute('SELECT puuid, channel_id FROM player_channels ORDER BY rowid'):
+            if puuid in players:
+                players[puuid].channel_ids.append(channel_id)
+        for puuid, hour, games in db.execute('SELECT puuid, hour, games FROM player_hours'):
+            if puuid in players:
+                players[puuid].play_hours[hour] = games
+        self.players = players
+        self.states = {puuid: self.states.get(puuid) or PlayerState() for puuid in players}
+
+    def on_change(self, listener):
+        self.listeners.append(listener)
+
+    def _changed(self):
+        for listener in self.listeners:
+            listener()
+
+    # Pick up players tracked or untracked by another worker process. Returns True if anything had changed.
+    def reload_if_changed(self):
+        if self._connect().execute('PRAGMA data_version').fetchone()[0] == self._version:
+            return False
+        self.load()
+        self._changed()
+        return True
+
+    # Announce a player's games in `channel_id`, alongside any channels already tracking them
+    def track(self, game_name, tag_line, puuid, channel_id):
+        with self._connect():
+            self._insert(game_name, tag_line, puuid, [channel_id])
+        self.load()
+        self._changed()
+        return self.players[puuid]
+
+    # Stop announcing a player's games in `channel_id`, dropping the player once no channel tracks them.
+    # Returns the player, or None if they were not tracked in that channel.
+    def untrack(self, puuid, channel_id):
+        db = self._connect()
+        with db:
+            deleted = db.execute('DELETE FROM player_channels WHERE puuid = ? AND channel_id = ?', (puuid, channel_id)).rowcount
+            if deleted and not db.execute('SELECT EXISTS (SELECT 1 FROM player_channels WHERE puuid = ?)', (puuid,)).fetchone()[0]:
+                db.execute('DELETE FROM player_hours WHERE puuid = ?', (puuid,))
+                db.execute('DELETE FROM players WHERE puuid = ?', (puuid,))
+        player = self.players.get(puuid)
+        self.load()
+        self._changed()
+        return player if deleted else None
+
+    # Count a game the player started during local `hour`
+    def record_game_start(self, player, hour):
+        player.play_hours[hour] += 1
+        with self._connect() as db:
+            db.execute(
+                'INSERT INTO player_hours (puuid, hour, games) VALUES (?, ?, 1) '
+                'ON CONFLICT (puuid, hour) DO UPDATE SET games = games + 1',
+                (player.puuid, hour),
+            )
+
+    def get(self, puuid):
+        return self.players.get(puuid)
+
+    # Find a tracked player by "gamename#tagline" (case-insensitive)
+    def find(self, riot_id):
+        riot_id = riot_id.lower()
+        return next((p for p in self.players.values() if p.riot_id.lower() == riot_id), None)
+
+    # Tracked players taking part in a parsed match or live game
+    def tracked_in(self, match):
+        return [self.players[participant.puuid] for participant in match.find_players(self.players)]
+
+    def __iter__(self):
+        return iter(list(self.players.values()))
+
+    def __len__(self):
+        return len(self.players)
+
+    def __contains__(self, puuid):
+        return puuid in self.players
+
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+# Shared registry used by the spectator scheduler and the slash commands
+registry = PlayerRegistry()
@@ -0,0 +1,43 @@
+import json
+import os
+import urllib.request
+
+from static_data import STATIC_DATA_DIR
+
+VERSIONS_URL = 'https://ddragon.leagueoflegends.com/api/versions.json'
+DDRAGON_URL = 'https://ddragon.leagueoflegends.com/cdn/{version}/data/en_US/{name}'
+QUEUES_URL = 'https://static.developer.riotgames.com/docs/lol/queues.json'
+
+
+def fetch_json(url):
+    with urllib.request.urlopen(url, timeout=30) as response:
+        return json.load(response)
+
+
+# Download the newest Data Dragon patch into static_data/<version>/. The running bot
+# picks it up on its next static data check, no restart needed.
+def update_static_data(directory=STATIC_DATA_DIR):
+    version = fetch_json(VERSIONS_URL)[0]
+    version_dir = os.path.join(directory, version)
+    if os.path.isdir(version_dir):
+        print(f"Static data for patch {version} is already present.")
+        return version
+
+    # Write into a temporary directory first so the bot never sees a partial patch
+    tmp_dir = f'{version_dir}.tmp'
+    os.makedirs(tmp_dir, exist_ok=True)
+    files = {
+        'champion.json': DDRAGON_URL.format(version=version, name='champion.json'),
+        'summoner.json': DDRAGON_URL.format(version=version, name='summoner.json'),
+        'queues.json': QUEUES_URL,
+    }
+    for name, url in files.items():
+        with open(os.path.join(tmp_dir, name), 'w', encoding='utf-8') as f:
+            json.dump(fetch_json(url), f, ensure_ascii=False)
+    os.rename(tmp_dir, version_dir)
+    print(f"Downloaded static data for patch {version}.")
+    return version
+
+
+if __name__ == "__main__":
+    update_static_data()
@@ -0,0 +1,343 @@
+import asyncio
+import json
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+
+from rate_limiter import PRIORITY_COMMAND, PRIORITY_BACKGROUND
+from match_cache import CACHE_DIR
+from match_history import MatchHistory, get_match_details
+from match_view import MatchView, ParticipantView, parse_match
+from tracking import registry
+from events import MatchResult
+from metrics import metrics
+
+WAREHOUSE_PATH = os.path.join(CACHE_DIR, 'history.sqlite3')
+SYNC_INTERVAL = 10 * 60  # Seconds between background syncs of every tracked player
+SYNC_BATCH = 100  # Most new matches downloaded for one player in one sync, oldest first
+BACKFILL_BATCH = 20  # Older matches downloaded per tracked player in each background sync
+MAX_DOWNLOAD_FAILURES = 3  # Syncs a listed match may fail to download in before it is skipped for good
+IDS_PER_CALL = 100  # Match ids requested per match-v5 ids call (Riot's maximum)
+DAY_MS = 24 * 3600 * 1000
+
+SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS matches ('
+    'match_id TEXT PRIMARY KEY, queue_id INTEGER NOT NULL, game_creation INTEGER NOT NULL, '
+    'duration INTEGER NOT NULL, banned_champion_ids TEXT NOT NULL)',
+    'CREATE TABLE IF NOT EXISTS participants ('
+    'match_id TEXT NOT NULL REFERENCES matches (match_id), puuid TEXT NOT NULL, champion_id INTEGER NOT NULL, '
+    'team_id INTEGER NOT NULL, win INTEGER NOT NULL, kills INTEGER NOT NULL, deaths INTEGER NOT NULL, '
+    'assists INTEGER NOT NULL, cs INTEGER NOT NULL, spell1_id INTEGER NOT NULL, spell2_id INTEGER NOT NULL, '
+    'PRIMARY KEY (match_id, puuid))',
+    'CREATE INDEX IF NOT EXISTS participants_puuid ON participants (puuid)',
+    'CREATE INDEX IF NOT EXISTS matches_game_creation ON matches (game_creation)',
+    'CREATE INDEX IF NOT EXISTS matches_queue_id ON matches (queue_id)',
+    # How much of each player's history has been pulled: gameCreation (epoch ms) of the newest and
+    # oldest synced match, and whether the oldest end has been reached
+    'CREATE TABLE IF NOT EXISTS synced_players ('
+    'puuid TEXT PRIMARY KEY, newest INTEGER NOT NULL, oldest INTEGER NOT NULL, complete INTEGER NOT NULL)',
+    # Listed matches whose details could not be downloaded, and how many syncs they failed in
+    'CREATE TABLE IF NOT EXISTS failed_matches (match_id TEXT PRIMARY KEY, failures INTEGER NOT NULL)',
+    # Running totals per player, UTC day (days since the epoch), queue and champion, added to as each
+    # match is stored so stats over any window are a sum over a few hundred rows at most
+    'CREATE TABLE IF NOT EXISTS player_stats ('
+    'puuid TEXT NOT NULL, day INTEGER NOT NULL, queue_id INTEGER NOT NULL, champion_id INTEGER NOT NULL, '
+    'games INTEGER NOT NULL, wins INTEGER NOT NULL, kills INTEGER NOT NULL, deaths INTEGER NOT NULL, '
+    'assists INTEGER NOT NULL, cs INTEGER NOT NULL, seconds INTEGER NOT NULL, '
+    'PRIMARY KEY (puuid, day, queue_id, champion_id))',
+)
+
+STATS_UPSERT = (
+    'INSERT INTO player_stats (puuid, day, queue_id, champion_id, games, wins, kills, deaths, assists, cs, seconds) '
+    'VALUES (?, ?, ?, ?, 1, ?, ?, ?, ?, ?, ?) '
+    'ON CONFLICT (puuid, day, queue_id, champion_id) DO UPDATE SET '
+    'games = games + 1, wins = wins + excluded.wins, kills = kills + excluded.kills, deaths = deaths + excluded.deaths, '
+    'assists = assists + excluded.assists, cs = cs + excluded.cs, seconds = seconds + excluded.seconds'
+)
+
+# Totals for rows stored before player_stats existed
+STATS_REBUILD = (
+    'INSERT INTO player_stats (puuid, day, queue_id, champion_id, games, wins, kills, deaths, assists, cs, seconds) '
+    f'SELECT p.puuid, m.game_creation / {DAY_MS}, m.queue_id, p.champion_id, COUNT(*), SUM(p.win), SUM(p.kills), '
+    'SUM(p.deaths), SUM(p.assists), SUM(p.cs), SUM(m.duration) '
+    'FROM participants p JOIN matches m USING (match_id) GROUP BY 1, 2, 3, 4'
+)
+
+PARTICIPANT_COLUMNS = 'match_id, puuid, champion_id, team_id, win, kills, deaths, assists, cs, spell1_id, spell2_id'
+
+
+@dataclass(slots=True)
+class SyncState:
+    newest: int
+    oldest: int
+    complete: bool
+
+
+# Summed stats over a group of games
+@dataclass(slots=True)
+class StatLine:
+    games: int
+    wins: int
+    kills: int
+    deaths: int
+    assists: int
+    cs: int
+    seconds: int
+
+    @property
+    def winrate(self):
+        return self.wins / self.games * 100
+
+    @property
+    def kda(self):
+        return (self.kills + self.assists) / max(self.deaths, 1)
+
+    @property
+    def cs_per_minute(self):
+        return self.cs / max(self.seconds / 60, 1)
+
+    @property
+    def deaths_per_game(self):
+        return self.deaths / self.games
+
+
+# Normalized local copy of the match history of every player that has been looked up.
+# Commands read from indexed queries here; Riot is only asked for match ids newer (or, when
+# backfilling, older) than what is already stored, and details only for matches not stored yet.
+class Warehouse:
+    def __init__(self, path=WAREHOUSE_PATH):
+        self.path = path
+        self._db = None
+        self._locks = {}  # PUUID -> lock so one player is never synced twice at once
+
+    def _connect(self):
+        if self._db is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            self._db = sqlite3.connect(self.path)
+            for statement in SCHEMA:
+                self._db.execute(statement)
+            if self._db.execute('SELECT NOT EXISTS (SELECT 1 FROM player_stats)').fetchone()[0]:
+                self._db.execute(STATS_REBUILD)
+                self._db.commit()
+        return self._db
+
+    # Store a parsed match and all of its participants, adding them to the running stats.
+    # A finished match never changes, so storing one twice is a no-op.
+    def store(self, match):
+        db = self._connect()
+        if db.execute('SELECT 1 FROM matches WHERE match_id = ?', (match.match_id,)).fetchone():
+            return
+        db.execute(
+            'INSERT INTO matches (match_id, queue_id, game_creation, duration, banned_champion_ids) VALUES (?, ?, ?, ?, ?)',
+            (match.match_id, match.queue_id, match.game_creation, match.duration, json.dumps(match.banned_champion_ids)),
+        )
+        db.executemany(
+            f'INSERT INTO participants ({PARTICIPANT_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            [(match.match_id, p.puuid, p.champion_id, p.team_id, p.win, p.kills, p.deaths, p.assists, p.cs, p.spell1_id, p.spell2_id)
+             for p in match.participants],
+        )
+        day = match.game_creation // DAY_MS
+        db.executemany(
+            STATS_UPSERT,
+            [(p.puuid, day, match.queue_id, p.champion_id, p.win, p.kills, p.deaths, p.assists, p.cs, match.duration)
+             for p in match.participants],
+        )
+        db.commit()
+
+    def sync_state(self, puuid):
+        row = self._connect().execute('SELECT newest, oldest, complete FROM synced_players WHERE puuid = ?', (puuid,)).fetchone()
+        return SyncState(row[0], row[1], bool(row[2])) if row else None
+
+    def _save_sync_state(self, puuid, state):
+        db = self._connect()
+        db.execute(
+            'INSERT OR REPLACE INTO synced_players (puuid, newest, oldest, complete) VALUES (?, ?, ?, ?)',
+            (puuid, state.newest, state.oldest, state.complete),
+        )
+        db.commit()
+
+    # The stored matches among `match_ids`, keyed by match id
+    def matches_by_id(self, match_ids):
+        if not match_ids:
+            return {}
+        placeholders = ','.join('?' * len(match_ids))
+        rows = self._connect().execute(
+            'SELECT match_id, queue_id, game_creation, duration, banned_champion_ids '
+            f'FROM matches WHERE match_id IN ({placeholders})', list(match_ids),
+        ).fetchall()
+        return {match.match_id: match for match in self._load_matches(rows)}
+
+    # Build MatchViews from (match_id, queue_id, game_creation, duration, banned_champion_ids) rows
+    def _load_matches(self, rows):
+        if not rows:
+            return []
+        db = self._connect()
+        participants = {}
+        placeholders = ','.join('?' * len(rows))
+        for row in db.execute(f'SELECT {PARTICIPANT_COLUMNS} FROM participants WHERE match_id IN ({placeholders})', [r[0] for r in rows]):
+            participants.setdefault(row[0], []).append(row)
+
+        matches = []
+        for match_id, queue_id, game_creation, duration, bans in rows:
+            minutes = duration // 60 or 1
+            matches.append(MatchView(
+                match_id=match_id,
+                queue_id=queue_id,
+                game_creation=game_creation,
+                duration=duration,
+                participants=[
+                    ParticipantView(puuid, champion_id, team_id, bool(win), kills, deaths, assists, cs, cs / minutes, spell1_id, spell2_id)
+                    for _, puuid, champion_id, team_id, win, kills, deaths, assists, cs, spell1_id, spell2_id in participants.get(match_id, [])
+                ],
+                banned_champion_ids=json.loads(bans),
+            ))
+        return matches
+
+    # Run a read-only query for analytics that work on the raw rows
+    def query(self, sql, params=()):
+        return self._connect().execute(sql, params)
+
+    # A player's summed stats grouped by `group` ('champion_id', 'queue_id' or None for one total),
+    # optionally limited to the last `days` days. Returns {group value: StatLine}, most played first.
+    def player_stats(self, puuid, group=None, days=None):
+        if group not in (None, 'champion_id', 'queue_id'):
+            raise ValueError(f"Unknown stats grouping {group}")
+        key = group or 'NULL'
+        query = (f'SELECT {key}, SUM(games), SUM(wins), SUM(kills), SUM(deaths), SUM(assists), SUM(cs), SUM(seconds) '
+                 'FROM player_stats WHERE puuid = ?')
+        params = [puuid]
+        if days is not None:
+            query += ' AND day > ?'
+            params.append(int(time.time() * 1000) // DAY_MS - days)
+        if group:
+            query += f' GROUP BY {group}'
+        query += ' ORDER BY 2 DESC'
+        return {row[0]: StatLine(*row[1:]) for row in self._connect().execute(query, params) if row[1]}
+
+    # (games, oldest gameCreation, newest gameCreation) of a player's stored matches, optionally
+    # in the same last `days` days player_stats counts
+    def stored_range(self, puuid, days=None):
+        query = 'SELECT COUNT(*), MIN(m.game_creation), MAX(m.game_creation) FROM participants p JOIN matches m USING (match_id) WHERE p.puuid = ?'
+        params = [puuid]
+        if days is not None:
+            query += ' AND m.game_creation >= ?'
+            params.append((int(time.time() * 1000) // DAY_MS - days + 1) * DAY_MS)
+        return self._connect().execute(query, params).fetchone()
+
+    # Download and store one match, returning its MatchView or None if Riot didn't have it
+    async def fetch_match(self, match_id, priority=PRIORITY_COMMAND):
+        payload = await get_match_details(match_id, priority=priority)
+        if payload is None:
+            return None
+        match = parse_match(payload)
+        self.store(match)
+        return match
+
+    def _given_up(self, match_id):
+        row = self._connect().execute('SELECT failures FROM failed_matches WHERE match_id = ?', (match_id,)).fetchone()
+        return row is not None and row[0] >= MAX_DOWNLOAD_FAILURES
+
+    def _record_failure(self, match_id):
+        db = self._connect()
+        db.execute(
+            'INSERT INTO failed_matches (match_id, failures) VALUES (?, 1) '
+            'ON CONFLICT (match_id) DO UPDATE SET failures = failures + 1',
+            (match_id,),
+        )
+        db.commit()
+
+    # Download and store the matches in `match_ids` (newest first) that are not stored yet.
+    # Returns the gameCreation of every match in the stored, contiguous run that a sync can move
+    # past: with `oldest_first`, the matches older than the oldest failed download, otherwise the
+    # matches newer than the newest one. Matches given up on don't stop the run.
+    async def _ingest(self, match_ids, priority, oldest_first=True):
+        async def fetch(match_id):
+            row = self._connect().execute('SELECT game_creation FROM matches WHERE match_id = ?', (match_id,)).fetchone()
+            if row:
+                return row[0]
+            if self._given_up(match_id):
+                return None
+            match = await self.fetch_match(match_id, priority)
+            if match is None:
+                self._record_failure(match_id)
+                return None
+            return match.game_creation
+
+        results = await asyncio.gather(*(fetch(match_id) for match_id in match_ids))
+        blocked = [i for i, (match_id, created) in enumerate(zip(match_ids, results)) if created is None and not self._given_up(match_id)]
+        if blocked:
+            results = results[blocked[-1] + 1:] if oldest_first else results[:blocked[0]]
+        return [created for created in results if created is not None], not blocked
+
+    # Store up to `batch` of the matches played since the newest synced one, oldest first, so the
+    # synced range never has holes and the next sync carries on where this one stopped.
+    # A player who was never synced starts from their `batch` most recent matches.
+    async def sync_player(self, puuid, batch=SYNC_BATCH, priority=PRIORITY_BACKGROUND):
+        lock = self._locks.setdefault(puuid, asyncio.Lock())
+        if lock.locked():
+            # A sync of this player is already running, share its result instead of repeating it
+            async with lock:
+                return
+        async with lock:
+            state = self.sync_state(puuid)
+            if state is None:
+                match_ids = await MatchHistory(puuid, priority=priority).get_ids(0, batch)
+                created, all_settled = await self._ingest(match_ids, priority, oldest_first=False)
+                if created:
+                    self._save_sync_state(puuid, SyncState(max(created), min(created), all_settled and len(match_ids) < batch))
+                return
+
+            # Every id since the newest synced match (ids are cheap next to details), newest first
+            history = MatchHistory(puuid, start_time=state.newest // 1000 + 1, page_size=IDS_PER_CALL, priority=priority)
+            while not history.exhausted:
+                await history.get_ids(len(history.ids), IDS_PER_CALL)
+            # A failed download stops `newest` just short of it, so the next sync retries it
+            created, _ = await self._ingest(history.ids[-batch:], priority)
+            if created:
+                state.newest = max(state.newest, max(created))
+                self._save_sync_state(puuid, state)
+
+    # Store up to `batch` matches older than the oldest synced one, newest first, until the
+    # start of the player's history on Riot is reached
+    async def backfill(self, puuid, batch=BACKFILL_BATCH, priority=PRIORITY_BACKGROUND):
+        async with self._locks.setdefault(puuid, asyncio.Lock()):
+            state = self.sync_state(puuid)
+            if state is None or state.complete:
+                return
+            match_ids = await MatchHistory(puuid, end_time=state.oldest // 1000 - 1, priority=priority).get_ids(0, batch)
+            created, all_settled = await self._ingest(match_ids, priority, oldest_first=False)
+            if created:
+                state.oldest = min(state.oldest, min(created))
+            state.complete = all_settled and len(match_ids) < batch
+            self._save_sync_state(puuid, state)
+
+    async def on_match_result(self, event):
+        self.store(event.match)
+
+    def subscribe(self, bus):
+        bus.subscribe(MatchResult, self.on_match_result)
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+# Shared warehouse used by the history commands and the sync job
+warehouse = Warehouse()
+
+
+# Keep every tracked player's history current in the background, and fill in older games a batch at a time
+async def sync_history(coordinator=None):
+    while True:
+        for player in registry:
+            if coordinator is not None and not coordinator.owns(player.puuid):
+                continue  # Synced by the worker that polls them
+            try:
+                await warehouse.sync_player(player.puuid)
+                await warehouse.backfill(player.puuid)
+            except Exception as e:
+                print(f"Error syncing match history for {player.riot_id}: {e}")
+                metrics.error('history_sync')
+        await asyncio.sleep(SYNC_INTERVAL)
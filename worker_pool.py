@@ -0,0 +1,55 @@
+import asyncio
+import functools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from metrics import metrics
+
+MAX_WORKERS = min(4, os.cpu_count() or 1)
+MAX_QUEUE_DEPTH = 32  # Jobs running or waiting before new ones are turned away
+
+
+class PoolFull(Exception):
+    pass
+
+
+# Bounded executor for CPU-bound stages (large decodes, stats over long histories) so they
+# run beside the event loop instead of on it. Jobs must not touch the loop's SQLite
+# connections or Discord objects; with processes=True they must also be picklable.
+class WorkerPool:
+    def __init__(self, name, max_workers=MAX_WORKERS, max_queue_depth=MAX_QUEUE_DEPTH, processes=False):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue_depth = max_queue_depth
+        self.processes = processes
+        self.depth = 0
+        self._executor = None
+
+    def _get_executor(self):
+        if self._executor is None:
+            executor_class = ProcessPoolExecutor if self.processes else ThreadPoolExecutor
+            self._executor = executor_class(max_workers=self.max_workers)
+        return self._executor
+
+    # Run `func(*args, **kwargs)` in the pool. Raises PoolFull instead of queueing past the depth limit.
+    async def run(self, func, *args, **kwargs):
+        if self.depth >= self.max_queue_depth:
+            metrics.error(f'{self.name}_pool_full')
+            raise PoolFull(f"{self.name} pool has {self.depth} jobs queued")
+        self.depth += 1
+        started = time.perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._get_executor(), functools.partial(func, *args, **kwargs))
+        finally:
+            self.depth -= 1
+            metrics.observe_worker_job(self.name, time.perf_counter() - started)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# Shared pool for decoding and stats work
+cpu_pool = WorkerPool('cpu')